@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from contextlib import suppress
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import logging
 
 from homeassistant.config_entries import ConfigEntry
@@ -76,6 +76,9 @@ _THERMAL_ENERGY_KEYS = (
     "thermal_energy_cooling_daily",
     "thermal_energy_cooling_total",
 )
+_THERMAL_DAILY_KEYS = frozenset(
+    {"thermal_energy_heating_daily", "thermal_energy_cooling_daily"}
+)
 
 
 async def _async_first_refresh_tolerating_gateway_not_ready(
@@ -160,9 +163,15 @@ async def _async_restore_thermal_energy(
     entry: HitachiYutakiConfigEntry,
     coordinator: HitachiYutakiDataCoordinator,
 ) -> None:
-    """Restore thermal energy accumulators from HA's last state cache."""
+    """Restore thermal energy accumulators from HA's last state cache.
+
+    Daily counters are only restored when their last state was written today:
+    a value from an earlier day has already rolled over at midnight.
+    """
     restore_data = async_get_restore_data(hass)
     entity_registry = er.async_get(hass)
+    # Same local calendar as the accumulator's midnight reset
+    today = date.today()
 
     for key in _THERMAL_ENERGY_KEYS:
         unique_id = f"{entry.entry_id}_{key}"
@@ -174,6 +183,11 @@ async def _async_restore_thermal_energy(
                 and last.state
                 and last.state.state not in (None, "unknown", "unavailable", "")
             ):
+                if (
+                    key in _THERMAL_DAILY_KEYS
+                    and last.state.last_updated.astimezone().date() != today
+                ):
+                    continue
                 with suppress(ValueError, TypeError):
                     coordinator.derived_metrics.restore_thermal_energy(
                         key, float(last.state.state)
@@ -792,6 +806,10 @@ async def async_unload_entry(
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator = entry.runtime_data
 
+        # Stop polling and drop any debounced refresh so nothing reconnects
+        # the gateway after it is closed below
+        await coordinator.async_shutdown()
+
         # Flush remaining telemetry data before closing
         await coordinator.async_flush_telemetry()
 
@@ -64,6 +64,14 @@ COMPRESSOR_HISTORY_SIZE = 100
 REFRIGERANT_STORE_VERSION = 1
 REFRIGERANT_SAVE_DELAY_S = 600  # debounce persisted writes (flush is daily)
 
+# Thermal energy sensor key -> ThermalPowerService.restore() keyword
+_THERMAL_RESTORE_COUNTERS = {
+    "thermal_energy_heating_daily": "daily_heating",
+    "thermal_energy_heating_total": "total_heating",
+    "thermal_energy_cooling_daily": "daily_cooling",
+    "thermal_energy_cooling_total": "total_cooling",
+}
+
 
 class DerivedMetricsAdapter:
     """Computes derived metrics and injects them into the coordinator data dict."""
@@ -169,22 +177,31 @@ class DerivedMetricsAdapter:
         self, has_cooling: bool, has_dhw: bool, has_pool: bool
     ) -> None:
         """Initialize COP services for the configured modes."""
-        self._cop_services = {}
-        self._cop_services["cop_heating"] = self._make_cop_service(
-            thermal_power_calculator_heating_wrapper, MODE_HEATING
-        )
+        modes: list[tuple[str, Any, str]] = [
+            ("cop_heating", thermal_power_calculator_heating_wrapper, MODE_HEATING)
+        ]
         if has_cooling:
-            self._cop_services["cop_cooling"] = self._make_cop_service(
-                thermal_power_calculator_cooling_wrapper, MODE_COOLING
+            modes.append(
+                ("cop_cooling", thermal_power_calculator_cooling_wrapper, MODE_COOLING)
             )
         if has_dhw:
-            self._cop_services["cop_dhw"] = self._make_cop_service(
-                thermal_power_calculator_heating_wrapper, MODE_DHW
+            modes.append(
+                ("cop_dhw", thermal_power_calculator_heating_wrapper, MODE_DHW)
             )
         if has_pool:
-            self._cop_services["cop_pool"] = self._make_cop_service(
-                thermal_power_calculator_heating_wrapper, MODE_POOL
+            modes.append(
+                ("cop_pool", thermal_power_calculator_heating_wrapper, MODE_POOL)
+            )
+
+        self._cop_services = {}
+        # Operation states each COP sensor accepts during history replay; fixed
+        # per mode, so resolved here rather than on every rehydration.
+        self._cop_accepted_states: dict[str, frozenset[str]] = {}
+        for cop_key, thermal_calculator, mode in modes:
+            self._cop_services[cop_key] = self._make_cop_service(
+                thermal_calculator, mode
             )
+            self._cop_accepted_states[cop_key] = get_accepted_operation_states(mode)
 
     def update(self, data: dict[str, Any]) -> None:
         """Enrich data dict with all derived metrics."""
@@ -199,8 +216,17 @@ class DerivedMetricsAdapter:
         is_defrosting = data.get("is_defrosting", False)
         self.defrost_guard.update(is_defrosting=is_defrosting, delta_t=delta_t)
 
-        self._update_thermal(data)
-        self._update_cop(data)
+        # Water temperatures (external sensors take precedence), read once per
+        # tick and shared by the thermal and COP calculations.
+        inlet = self._get_temperature(
+            data, CONF_WATER_INLET_TEMP_ENTITY, "water_inlet_temp"
+        )
+        outlet = self._get_temperature(
+            data, CONF_WATER_OUTLET_TEMP_ENTITY, "water_outlet_temp"
+        )
+
+        self._update_thermal(data, inlet, outlet)
+        self._update_cop(data, inlet, outlet)
         self._update_energy(data)
         self._update_timing(data)
         self._update_refrigerant(data)
@@ -295,7 +321,12 @@ class DerivedMetricsAdapter:
                     return "cooling"
         return None
 
-    def _update_cop(self, data: dict[str, Any]) -> None:
+    def _update_cop(
+        self,
+        data: dict[str, Any],
+        water_inlet: float | None,
+        water_outlet: float | None,
+    ) -> None:
         """Compute electrical power and COP for all configured modes."""
         # Electrical power — call the calculator ONCE with the summed current.
         #
@@ -334,12 +365,8 @@ class DerivedMetricsAdapter:
         operation_mode = resolve_operation_mode(data.get("operation_state"))
 
         cop_input = COPInput(
-            water_inlet_temp=self._get_temperature(
-                data, CONF_WATER_INLET_TEMP_ENTITY, "water_inlet_temp"
-            ),
-            water_outlet_temp=self._get_temperature(
-                data, CONF_WATER_OUTLET_TEMP_ENTITY, "water_outlet_temp"
-            ),
+            water_inlet_temp=water_inlet,
+            water_outlet_temp=water_outlet,
             water_flow=data.get("water_flow"),
             compressor_current=data.get("compressor_current"),
             compressor_frequency=data.get("compressor_frequency"),
@@ -369,14 +396,13 @@ class DerivedMetricsAdapter:
             data[f"{key}_measurements"] = quality.measurements
             data[f"{key}_time_span_minutes"] = quality.time_span_minutes
 
-    def _update_thermal(self, data: dict[str, Any]) -> None:
+    def _update_thermal(
+        self,
+        data: dict[str, Any],
+        water_inlet: float | None,
+        water_outlet: float | None,
+    ) -> None:
         """Compute thermal power and energy, inject into data."""
-        water_inlet = self._get_temperature(
-            data, CONF_WATER_INLET_TEMP_ENTITY, "water_inlet_temp"
-        )
-        water_outlet = self._get_temperature(
-            data, CONF_WATER_OUTLET_TEMP_ENTITY, "water_outlet_temp"
-        )
         water_flow = data.get("water_flow")
 
         if not self.defrost_guard.is_data_reliable:
@@ -394,39 +420,29 @@ class DerivedMetricsAdapter:
             operation_mode=operation_mode,
         )
 
-        data["thermal_power_heating"] = round(
-            self._thermal_service.get_heating_power(), 2
-        )
-        if self._has_cooling:
-            data["thermal_power_cooling"] = round(
-                self._thermal_service.get_cooling_power(), 2
-            )
-
-        data["thermal_energy_heating_daily"] = round(
-            self._thermal_service.get_daily_heating_energy(), 2
+        # The service getters already round to 2 decimals
+        thermal_service = self._thermal_service
+        data["thermal_power_heating"] = thermal_service.get_heating_power()
+        data["thermal_energy_heating_daily"] = (
+            thermal_service.get_daily_heating_energy()
         )
-        data["thermal_energy_heating_total"] = round(
-            self._thermal_service.get_total_heating_energy(), 2
+        data["thermal_energy_heating_total"] = (
+            thermal_service.get_total_heating_energy()
         )
         if self._has_cooling:
-            data["thermal_energy_cooling_daily"] = round(
-                self._thermal_service.get_daily_cooling_energy(), 2
+            data["thermal_power_cooling"] = thermal_service.get_cooling_power()
+            data["thermal_energy_cooling_daily"] = (
+                thermal_service.get_daily_cooling_energy()
             )
-            data["thermal_energy_cooling_total"] = round(
-                self._thermal_service.get_total_cooling_energy(), 2
+            data["thermal_energy_cooling_total"] = (
+                thermal_service.get_total_cooling_energy()
             )
 
     def restore_thermal_energy(self, key: str, value: float) -> None:
         """Restore thermal energy state from HA last state cache."""
-        restore_map = {
-            "thermal_energy_heating_daily": self._thermal_service.restore_daily_heating_energy,
-            "thermal_energy_heating_total": self._thermal_service.restore_total_heating_energy,
-            "thermal_energy_cooling_daily": self._thermal_service.restore_daily_cooling_energy,
-            "thermal_energy_cooling_total": self._thermal_service.restore_total_cooling_energy,
-        }
-        restore_fn = restore_map.get(key)
-        if restore_fn:
-            restore_fn(value)
+        counter = _THERMAL_RESTORE_COUNTERS.get(key)
+        if counter:
+            self._thermal_service.restore(**{counter: value})
 
     def restore_electricity_cost(self, value: float) -> None:
         """Restore electricity cost state from HA last state cache."""
@@ -452,54 +468,37 @@ class DerivedMetricsAdapter:
             COP_MEASUREMENTS_PERIOD,
         )
 
-        registry = er.async_get(self._hass)
-        entry_id = self._config_entry.entry_id
-
-        # Build entity map (resolve entity_ids from unique_ids)
-        entity_map: dict[str, str] = {}
-
-        # Check for user-configured external entities first
-        inlet_entity = self._config_entry_data.get(CONF_WATER_INLET_TEMP_ENTITY)
-        if inlet_entity:
-            entity_map["water_inlet_temp"] = inlet_entity
-        else:
-            eid = registry.async_get_entity_id(
-                "sensor", DOMAIN, f"{entry_id}_water_inlet_temp"
-            )
-            if eid:
-                entity_map["water_inlet_temp"] = eid
-
-        outlet_entity = self._config_entry_data.get(CONF_WATER_OUTLET_TEMP_ENTITY)
-        if outlet_entity:
-            entity_map["water_outlet_temp"] = outlet_entity
-        else:
-            eid = registry.async_get_entity_id(
-                "sensor", DOMAIN, f"{entry_id}_water_outlet_temp"
+        # Build entity map (resolve entity_ids from unique_ids). User-configured
+        # external temperature entities take precedence over our own sensors.
+        entity_map: dict[str, str] = {
+            key: entity_id
+            for key, conf_key in (
+                ("water_inlet_temp", CONF_WATER_INLET_TEMP_ENTITY),
+                ("water_outlet_temp", CONF_WATER_OUTLET_TEMP_ENTITY),
             )
-            if eid:
-                entity_map["water_outlet_temp"] = eid
+            if (entity_id := self._config_entry_data.get(conf_key))
+        }
 
-        for key in (
+        keys = [
+            "water_inlet_temp",
+            "water_outlet_temp",
             "water_flow",
             "compressor_current",
             "compressor_frequency",
             "operation_state",
-        ):
-            eid = registry.async_get_entity_id("sensor", DOMAIN, f"{entry_id}_{key}")
+        ]
+        if self._supports_secondary_compressor:
+            keys += ["secondary_compressor_current", "secondary_compressor_frequency"]
+
+        registry = er.async_get(self._hass)
+        uid_prefix = f"{self._config_entry.entry_id}_"
+        for key in keys:
+            if key in entity_map:
+                continue
+            eid = registry.async_get_entity_id("sensor", DOMAIN, uid_prefix + key)
             if eid:
                 entity_map[key] = eid
 
-        if self._supports_secondary_compressor:
-            for key in (
-                "secondary_compressor_current",
-                "secondary_compressor_frequency",
-            ):
-                eid = registry.async_get_entity_id(
-                    "sensor", DOMAIN, f"{entry_id}_{key}"
-                )
-                if eid:
-                    entity_map[key] = eid
-
         # Optional external power/voltage meters (#316): include their *historical*
         # values so each replayed point uses its own power, not a single live read.
         power_entity = self._config_entry_data.get(CONF_POWER_ENTITY)
@@ -511,9 +510,7 @@ class DerivedMetricsAdapter:
 
         # Rehydrate each COP service
         for cop_key, service in self._cop_services.items():
-            accepted_states: set[str] | None = None
-            if service._expected_mode:
-                accepted_states = get_accepted_operation_states(service._expected_mode)
+            accepted_states = self._cop_accepted_states.get(cop_key)
 
             try:
                 measurements = await async_replay_cop_history(
@@ -527,7 +524,8 @@ class DerivedMetricsAdapter:
                     is_three_phase=self._is_three_phase,
                 )
                 if measurements:
-                    service.preload_measurements(measurements)
+                    # Replayed history is returned in timestamp order
+                    service.preload_measurements(measurements, assume_sorted=True)
                     _LOGGER.debug(
                         "Rehydrated %d COP measurements for %s",
                         len(measurements),
@@ -16,6 +16,12 @@ _OPERATION_STATE_TO_MODE: dict[str, str] = {
     "operation_state_pool_on": MODE_POOL,
 }
 
+# Inverse of the above: domain mode to the Modbus states that report it.
+_MODE_TO_ACCEPTED_STATES: dict[str, frozenset[str]] = {
+    mode: frozenset(raw for raw, m in _OPERATION_STATE_TO_MODE.items() if m == mode)
+    for mode in set(_OPERATION_STATE_TO_MODE.values())
+}
+
 
 def resolve_operation_mode(operation_state: str | None) -> str | None:
     """Resolve a Modbus operation state string to a domain operation mode."""
@@ -24,6 +30,6 @@ def resolve_operation_mode(operation_state: str | None) -> str | None:
     return _OPERATION_STATE_TO_MODE.get(operation_state)
 
 
-def get_accepted_operation_states(mode: str) -> set[str]:
+def get_accepted_operation_states(mode: str) -> frozenset[str]:
     """Return Modbus operation state keys that match a given domain mode."""
-    return {raw for raw, m in _OPERATION_STATE_TO_MODE.items() if m == mode}
+    return _MODE_TO_ACCEPTED_STATES.get(mode, frozenset())
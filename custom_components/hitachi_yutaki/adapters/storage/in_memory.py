@@ -3,15 +3,15 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import TypeVar
 
-from ...domain.ports.storage import Storage
 
-T = TypeVar("T")
+class InMemoryStorage[T]:
+    """In-memory storage implementation using a deque.
 
+    Satisfies the ``Storage[T]`` port structurally.
+    """
 
-class InMemoryStorage(Storage[T]):
-    """In-memory storage implementation using a deque."""
+    __slots__ = ("_data",)
 
     def __init__(self, max_len: int | None = None) -> None:
         """Initialize the in-memory storage.
@@ -43,6 +43,15 @@ class InMemoryStorage(Storage[T]):
         """
         return self._data.popleft()
 
+    def peek_left(self) -> T | None:
+        """Return the leftmost item without removing it.
+
+        Returns:
+            The leftmost item, or None if storage is empty
+
+        """
+        return self._data[0] if self._data else None
+
     def get_all(self) -> list[T]:
         """Return all items in the storage.
 
@@ -31,7 +31,7 @@ async def async_replay_cop_history(
     window: timedelta,
     measurement_interval: int,
     max_measurements: int,
-    accepted_operation_states: set[str] | None = None,
+    accepted_operation_states: frozenset[str] | None = None,
     is_three_phase: bool = False,
 ) -> list[PowerMeasurement]:
     """Reconstruct power measurements from Recorder sensor history.
@@ -1,7 +1,7 @@
 """Modbus client for Hitachi heat pumps."""
 
 import asyncio
-import contextlib
+from functools import partial
 import logging
 import time
 from typing import Any
@@ -38,6 +38,16 @@ _UNIT_TABLE_CYCLE_OFFSET = 1
 # Sentinel written by the gateway for an empty/absent unit slot.
 _UNIT_TABLE_SENTINEL = 0xFF
 
+# Capability bits decoded once from system_config (see _capability_flags).
+_CAP_DHW = 1 << 0
+_CAP_POOL = 1 << 1
+_CAP_CIRCUIT_BITS: dict[tuple[CIRCUIT_IDS, CIRCUIT_MODES], int] = {
+    (CIRCUIT_PRIMARY_ID, CIRCUIT_MODE_HEATING): 1 << 2,
+    (CIRCUIT_PRIMARY_ID, CIRCUIT_MODE_COOLING): 1 << 3,
+    (CIRCUIT_SECONDARY_ID, CIRCUIT_MODE_HEATING): 1 << 4,
+    (CIRCUIT_SECONDARY_ID, CIRCUIT_MODE_COOLING): 1 << 5,
+}
+
 
 class ModbusApiClient(HitachiApiClient):
     """Modbus client for Hitachi heat pumps."""
@@ -57,6 +67,9 @@ class ModbusApiClient(HitachiApiClient):
         self._host = host
         self._port = port
         self._slave = slave
+        # The pymodbus device keyword depends only on the installed library
+        # version, so resolve it once instead of on every Modbus call.
+        self._device_kwargs: dict[str, int] = {get_pymodbus_device_param(): slave}
         self._client = ModbusTcpClient(host=host, port=port)
         self._lock = None
         self._data = {}
@@ -66,6 +79,12 @@ class ModbusApiClient(HitachiApiClient):
         self._connection_retries = 0
         self._gateway_not_ready_since: float | None = None
         self._gateway_not_ready_last_log: float = 0.0
+        self._caps: int = 0
+        # Repair issue currently raised for system_state; issues are only
+        # created/deleted on transitions, starting with a full sweep.
+        self._state_issue: str | None = None
+        self._state_issues_synced: bool = False
+        self._caps_system_config: int | None = None
 
     async def _ensure_connection(self) -> bool:
         """Ensure we have a working Modbus connection with retry logic."""
@@ -115,6 +134,19 @@ class ModbusApiClient(HitachiApiClient):
         self._connection_retries += 1
         return False
 
+    async def _close_after_error(self) -> None:
+        """Close the socket after a communication error, if it is still open.
+
+        A client whose socket is already closed is left alone, saving an
+        executor round trip; close errors are logged and otherwise ignored.
+        """
+        if not self._client.is_socket_open():
+            return
+        try:
+            await self._hass.async_add_executor_job(self._client.close)
+        except Exception as exc:  # noqa: BLE001 - best-effort reset before reconnecting
+            _LOGGER.debug("Error closing Modbus connection: %s", exc)
+
     @property
     def register_map(self) -> HitachiRegisterMap:
         """Return the register map for the gateway."""
@@ -154,14 +186,12 @@ class ModbusApiClient(HitachiApiClient):
             or None if the registers cannot be read.
 
         """
-        device_param = get_pymodbus_device_param()
-
         try:
             result = await self._hass.async_add_executor_job(
                 lambda: self._client.read_input_registers(
                     address=0,
                     count=3,
-                    **{device_param: self._slave},
+                    **self._device_kwargs,
                 )
             )
 
@@ -212,7 +242,6 @@ class ModbusApiClient(HitachiApiClient):
             cannot be read or holds the 0xFF sentinel (no unit in that slot).
 
         """
-        device_param = get_pymodbus_device_param()
         address = (
             _UNIT_TABLE_BASE + unit_id * _UNIT_TABLE_STRIDE + _UNIT_TABLE_CYCLE_OFFSET
         )
@@ -222,7 +251,7 @@ class ModbusApiClient(HitachiApiClient):
                 lambda: self._client.read_input_registers(
                     address=address,
                     count=1,
-                    **{device_param: self._slave},
+                    **self._device_kwargs,
                 )
             )
 
@@ -274,7 +303,6 @@ class ModbusApiClient(HitachiApiClient):
         register_address = (
             reg.write_address if reg.write_address is not None else reg.address
         )
-        device_param = get_pymodbus_device_param()
 
         retry_count = 0
         max_write_retries = 1  # Only retry once after reconnection
@@ -285,7 +313,7 @@ class ModbusApiClient(HitachiApiClient):
                     lambda: self._client.write_register(
                         address=register_address,
                         value=value,
-                        **{device_param: self._slave},
+                        **self._device_kwargs,
                     )
                 )
 
@@ -304,8 +332,7 @@ class ModbusApiClient(HitachiApiClient):
                     )
 
                     # Force connection reset
-                    with contextlib.suppress(Exception):
-                        await self._hass.async_add_executor_job(self._client.close)
+                    await self._close_after_error()
 
                     # Attempt immediate reconnection
                     if await self._ensure_connection():
@@ -324,24 +351,43 @@ class ModbusApiClient(HitachiApiClient):
                 _LOGGER.error("Error writing to register %s: %s", key, exc)
                 return False
 
+    def _capability_flags(self) -> int:
+        """Return the module capability bits decoded from system_config.
+
+        The register masks are only applied when the system_config value
+        changes, so the has_* predicates polled by entities reduce to a single
+        bit test.
+        """
+        system_config = self._data.get("system_config", 0)
+        if system_config != self._caps_system_config:
+            rmap = self._register_map
+            caps = 0
+            if system_config & rmap.mask_dhw:
+                caps |= _CAP_DHW
+            if system_config & rmap.mask_pool:
+                caps |= _CAP_POOL
+            for key, bit in _CAP_CIRCUIT_BITS.items():
+                if system_config & rmap.masks_circuit.get(key, 0):
+                    caps |= bit
+            self._caps = caps
+            self._caps_system_config = system_config
+        return self._caps
+
     @property
     def has_dhw(self) -> bool:
         """Return True if DHW is configured."""
-        system_config = self._data.get("system_config", 0)
-        return bool(system_config & self._register_map.mask_dhw)
+        return bool(self._capability_flags() & _CAP_DHW)
 
     def has_circuit(self, circuit_id: CIRCUIT_IDS, mode: CIRCUIT_MODES) -> bool:
         """Return True if circuit is configured."""
-        system_config = self._data.get("system_config", 0)
         return bool(
-            system_config & self._register_map.masks_circuit.get((circuit_id, mode))
+            self._capability_flags() & _CAP_CIRCUIT_BITS.get((circuit_id, mode), 0)
         )
 
     @property
     def has_pool(self) -> bool:
         """Return True if pool heating is configured."""
-        system_config = self._data.get("system_config", 0)
-        return bool(system_config & self._register_map.mask_pool)
+        return bool(self._capability_flags() & _CAP_POOL)
 
     def decode_config(self, data: dict[str, Any]) -> dict[str, Any]:
         """Decode raw config data into a dictionary of boolean flags.
@@ -401,10 +447,8 @@ class ModbusApiClient(HitachiApiClient):
     # Internal marker to distinguish sentinel-filtered None from read errors
     _SENTINEL_FILTERED = object()
 
-    async def _read_register(
-        self, definition: RegisterDefinition, device_param: str
-    ) -> Any:
-        """Read and deserialize a single register.
+    def _read_register_blocking(self, definition: RegisterDefinition) -> Any:
+        """Read and deserialize a single register (runs in the executor).
 
         Returns the deserialized value, _SENTINEL_FILTERED when the value is a
         gateway sentinel (unavailable sensor/module), or None when no fresh
@@ -414,12 +458,8 @@ class ModbusApiClient(HitachiApiClient):
         (after any fallback) as "no value" and clear the stored reading rather
         than retaining a stale one (see :meth:`read_values`, issue #320).
         """
-        result = await self._hass.async_add_executor_job(
-            lambda addr=definition.address, param=device_param: (
-                self._client.read_holding_registers(
-                    address=addr, count=1, **{param: self._slave}
-                )
-            )
+        result = self._client.read_holding_registers(
+            address=definition.address, count=1, **self._device_kwargs
         )
         if result.isError():
             return None
@@ -434,6 +474,51 @@ class ModbusApiClient(HitachiApiClient):
             return self._SENTINEL_FILTERED
         return value
 
+    def _read_registers_blocking(
+        self, registers: dict[str, RegisterDefinition]
+    ) -> dict[str, Any]:
+        """Read a set of registers in one executor job.
+
+        Registers are still read one Modbus transaction at a time (gateways
+        reject block reads spanning unmapped addresses), but the whole poll
+        costs a single thread hop instead of one per register. A None primary
+        value falls back to ``definition.fallback`` when set; a sentinel does
+        not (the module is known to be absent).
+        """
+        values: dict[str, Any] = {}
+        for name, definition in registers.items():
+            value = self._read_register_blocking(definition)
+            if value is None and definition.fallback:
+                value = self._read_register_blocking(definition.fallback)
+            values[name] = value
+        return values
+
+    def _sync_system_state_issues(self, raw_state: int) -> None:
+        """Raise the repair issue matching raw_state and clear the others.
+
+        The issue registry is only touched when the reported state changes
+        (and once on the first poll), not on every poll.
+        """
+        issues = self._register_map.system_state_issues
+        issue_key = issues.get(raw_state)
+        if self._state_issues_synced and issue_key == self._state_issue:
+            return
+
+        for other_key in issues.values():
+            if other_key != issue_key:
+                ir.async_delete_issue(self._hass, DOMAIN, other_key)
+        if issue_key is not None:
+            ir.async_create_issue(
+                self._hass,
+                DOMAIN,
+                issue_key,
+                is_fixable=False,
+                severity=ir.IssueSeverity.WARNING,
+                translation_key=issue_key,
+            )
+        self._state_issue = issue_key
+        self._state_issues_synced = True
+
     async def read_values(self, keys: list[str]) -> ReadResult:
         """Fetch data from the heat pump for the given keys.
 
@@ -449,23 +534,24 @@ class ModbusApiClient(HitachiApiClient):
 
         while retry_count <= max_read_retries:
             try:
-                device_param = get_pymodbus_device_param()
                 all_regs = self._register_map.all_registers
 
-                # Build a map of registers to read for this update
+                # Build a map of registers to read for this update. The
+                # preflight below already reads and stores system_state, so it
+                # is not read a second time.
                 registers_to_read = {
-                    key: all_regs[key] for key in keys if key in all_regs
+                    key: all_regs[key]
+                    for key in keys
+                    if key in all_regs and key != "system_state"
                 }
 
                 # Always perform a preflight check
-                system_state_addr = all_regs["system_state"].address
                 preflight_result = await self._hass.async_add_executor_job(
-                    lambda param=device_param, addr=system_state_addr: (
-                        self._client.read_holding_registers(
-                            address=addr,
-                            count=1,
-                            **{param: self._slave},
-                        )
+                    partial(
+                        self._client.read_holding_registers,
+                        address=all_regs["system_state"].address,
+                        count=1,
+                        **self._device_kwargs,
                     )
                 )
                 if preflight_result.isError():
@@ -483,41 +569,27 @@ class ModbusApiClient(HitachiApiClient):
                     self._data["system_state"] = raw_state
 
                 # Report system state issues and skip further reads
-                for (
-                    issue_state,
-                    issue_key,
-                ) in self._register_map.system_state_issues.items():
-                    if raw_state == issue_state:
-                        ir.async_create_issue(
-                            self._hass,
-                            DOMAIN,
-                            issue_key,
-                            is_fixable=False,
-                            severity=ir.IssueSeverity.WARNING,
-                            translation_key=issue_key,
+                self._sync_system_state_issues(raw_state)
+                if self._state_issue is not None:
+                    now = time.monotonic()
+                    if self._gateway_not_ready_since is None:
+                        # First detection
+                        self._gateway_not_ready_since = now
+                        self._gateway_not_ready_last_log = now
+                        _LOGGER.warning(
+                            "Gateway is not ready (state: %s), skipping further reads for this cycle.",
+                            raw_state,
                         )
-
-                        now = time.monotonic()
-                        if self._gateway_not_ready_since is None:
-                            # First detection
-                            self._gateway_not_ready_since = now
-                            self._gateway_not_ready_last_log = now
-                            _LOGGER.warning(
-                                "Gateway is not ready (state: %s), skipping further reads for this cycle.",
-                                raw_state,
-                            )
-                        elif now - self._gateway_not_ready_last_log >= 300:
-                            # Periodic reminder every 5 minutes
-                            elapsed = int(now - self._gateway_not_ready_since)
-                            self._gateway_not_ready_last_log = now
-                            _LOGGER.warning(
-                                "Gateway still not ready (state: %s), ongoing for %d minutes.",
-                                raw_state,
-                                elapsed // 60,
-                            )
-                        return ReadResult.GATEWAY_NOT_READY
-                    else:
-                        ir.async_delete_issue(self._hass, DOMAIN, issue_key)
+                    elif now - self._gateway_not_ready_last_log >= 300:
+                        # Periodic reminder every 5 minutes
+                        elapsed = int(now - self._gateway_not_ready_since)
+                        self._gateway_not_ready_last_log = now
+                        _LOGGER.warning(
+                            "Gateway still not ready (state: %s), ongoing for %d minutes.",
+                            raw_state,
+                            elapsed // 60,
+                        )
+                    return ReadResult.GATEWAY_NOT_READY
 
                 # Gateway is ready - reset throttle state if recovering
                 if self._gateway_not_ready_since is not None:
@@ -531,15 +603,10 @@ class ModbusApiClient(HitachiApiClient):
                     self._gateway_not_ready_since = None
                     self._gateway_not_ready_last_log = 0.0
 
-                for name, definition in registers_to_read.items():
-                    value = await self._read_register(definition, device_param)
-                    # Fallback on any None (read error or a sensor-error raw
-                    # value such as 0xFFFF deserialized to None), but not on
-                    # sentinel (sentinel = module known-absent, no point trying)
-                    if value is None and definition.fallback:
-                        value = await self._read_register(
-                            definition.fallback, device_param
-                        )
+                values = await self._hass.async_add_executor_job(
+                    partial(self._read_registers_blocking, registers_to_read)
+                )
+                for name, value in values.items():
                     if value is self._SENTINEL_FILTERED:
                         # Sensor/module unavailable — clear any stale value
                         self._data.pop(name, None)
@@ -554,7 +621,7 @@ class ModbusApiClient(HitachiApiClient):
                         _LOGGER.debug(
                             "Clearing %s (no fresh value: sensor error or read error at %s)",
                             name,
-                            definition.address,
+                            registers_to_read[name].address,
                         )
 
                 # Remove data for modules not declared in system_config
@@ -571,8 +638,7 @@ class ModbusApiClient(HitachiApiClient):
                     )
 
                     # Force connection reset
-                    with contextlib.suppress(Exception):
-                        await self._hass.async_add_executor_job(self._client.close)
+                    await self._close_after_error()
 
                     # Attempt immediate reconnection
                     if await self._ensure_connection():
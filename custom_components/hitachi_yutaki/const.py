@@ -1,6 +1,7 @@
 """Constants for the Hitachi Yutaki integration."""
 
 from enum import StrEnum
+from functools import cache
 from typing import Final, Literal
 
 from packaging import version
@@ -42,6 +43,11 @@ DEVICE_TYPES: Final = Literal[
 CIRCUIT_PRIMARY_ID: Final = 1
 CIRCUIT_SECONDARY_ID: Final = 2
 CIRCUIT_IDS: Final = Literal[CIRCUIT_PRIMARY_ID, CIRCUIT_SECONDARY_ID]
+# Entity register prefix -> circuit id (other prefixes have no circuit)
+CIRCUIT_ID_BY_PREFIX: Final[dict[str, CIRCUIT_IDS]] = {
+    "circuit1": CIRCUIT_PRIMARY_ID,
+    "circuit2": CIRCUIT_SECONDARY_ID,
+}
 
 CIRCUIT_MODE_HEATING: Final = "heating"
 CIRCUIT_MODE_COOLING: Final = "cooling"
@@ -138,7 +144,8 @@ WATER_FLOW_TO_KGS = 0.277778  # 1 m³/h = 1000 L/h = 1000 kg/h = 0.277778 kg/s
 WATER_SPECIFIC_HEAT = 4.185  # kJ/kg·K
 
 
-def get_pymodbus_device_param():
+@cache
+def get_pymodbus_device_param() -> str:
     """Get the correct parameter name for pymodbus device/slave based on version.
 
     Returns:
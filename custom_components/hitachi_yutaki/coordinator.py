@@ -11,7 +11,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_SCAN_INTERVAL,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
@@ -68,13 +68,15 @@ class HitachiYutakiDataCoordinator(DataUpdateCoordinator):
         """Initialize."""
         self.api_client = api_client
         self.profile = profile
-        self.entities: list[Any] = []
         self._defrost_guard = DefrostGuard()
 
         # Derived metrics adapter (injected by async_setup_entry)
         self.derived_metrics: DerivedMetricsAdapter | None = None
         self._normal_interval = timedelta(seconds=entry.data[CONF_SCAN_INTERVAL])
         self._gateway_not_ready_count: int = 0
+        # Whether the connection_error repair issue is raised; None until the
+        # first poll so a leftover issue is still cleared on the first success.
+        self._connection_issue_active: bool | None = None
         # Seed from persisted value (0 = unknown / never refreshed) so callers
         # of has_dhw/has_pool/has_circuit get sensible answers before the
         # first successful refresh. The api_client cache is the live source,
@@ -93,6 +95,10 @@ class HitachiYutakiDataCoordinator(DataUpdateCoordinator):
         self._telemetry_retry_delay: int = 30  # seconds, doubles on each failure
         self.telemetry_last_send: datetime | None = None
         self.telemetry_send_failures: int = 0
+        # The telemetry status changes outside the poll data (the buffer fills
+        # on every poll, flushes run on their own timer), so its sensor is
+        # notified directly instead of through the data-change listeners.
+        self._telemetry_listeners: list[CALLBACK_TYPE] = []
 
         super().__init__(
             hass,
@@ -100,6 +106,9 @@ class HitachiYutakiDataCoordinator(DataUpdateCoordinator):
             config_entry=entry,
             name=DOMAIN,
             update_interval=self._normal_interval,
+            # Poll results (raw registers and derived metrics) are a plain
+            # dict: skip listener callbacks when a poll returns equal data.
+            always_update=False,
         )
 
     @property
@@ -174,8 +183,10 @@ class HitachiYutakiDataCoordinator(DataUpdateCoordinator):
 
             # Poll succeeded: clear any connection error issue now, before
             # the post-fetch stages, so an enrichment bug cannot keep it
-            # alive or re-create it.
-            ir.async_delete_issue(self.hass, DOMAIN, "connection_error")
+            # alive or re-create it. Only on a transition, not every poll.
+            if self._connection_issue_active is not False:
+                ir.async_delete_issue(self.hass, DOMAIN, "connection_error")
+                self._connection_issue_active = False
 
         except UpdateFailed:
             # Re-raise so the generic Exception handler below doesn't
@@ -183,14 +194,16 @@ class HitachiYutakiDataCoordinator(DataUpdateCoordinator):
             raise
 
         except Exception as exc:
-            ir.async_create_issue(
-                self.hass,
-                DOMAIN,
-                "connection_error",
-                is_fixable=False,
-                severity=ir.IssueSeverity.ERROR,
-                translation_key="connection_error",
-            )
+            if self._connection_issue_active is not True:
+                ir.async_create_issue(
+                    self.hass,
+                    DOMAIN,
+                    "connection_error",
+                    is_fixable=False,
+                    severity=ir.IssueSeverity.ERROR,
+                    translation_key="connection_error",
+                )
+                self._connection_issue_active = True
             _LOGGER.warning("Error communicating with Hitachi Yutaki gateway: %s", exc)
             raise UpdateFailed("Failed to communicate with device") from exc
 
@@ -224,7 +237,10 @@ class HitachiYutakiDataCoordinator(DataUpdateCoordinator):
 
             # Telemetry: collect metrics from this poll cycle
             # (collector handles level=OFF internally)
+            buffered = self.telemetry_collector.buffer_size
             self.telemetry_collector.collect(data)
+            if self.telemetry_collector.buffer_size != buffered:
+                self._async_update_telemetry_listeners()
 
             # Re-arm the daily installation re-send before the send gate so a
             # stable install stays visible in WAE's 90-day fleet window.
@@ -383,6 +399,27 @@ class HitachiYutakiDataCoordinator(DataUpdateCoordinator):
             self.telemetry_send_failures += 1
             _LOGGER.warning("Telemetry flush failed", exc_info=True)
 
+        self._async_update_telemetry_listeners()
+
+    @callback
+    def async_add_telemetry_listener(
+        self, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for telemetry status changes; returns a remove callback."""
+        self._telemetry_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._telemetry_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_update_telemetry_listeners(self) -> None:
+        """Notify telemetry listeners that the status changed."""
+        for update_callback in list(self._telemetry_listeners):
+            update_callback()
+
     def has_circuit(self, circuit_id: CIRCUIT_IDS, mode: CIRCUIT_MODES) -> bool:
         """Return True if circuit is configured in system_config."""
         return self.api_client.has_circuit(circuit_id, mode)
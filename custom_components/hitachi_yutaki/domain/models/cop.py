@@ -15,7 +15,7 @@ class PowerMeasurement(NamedTuple):
     electrical_power: float  # kW
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class COPInput:
     """Input data for COP calculation."""
 
@@ -31,7 +31,7 @@ class COPInput:
     operation_mode: str | None = None  # MODE_HEATING, MODE_COOLING, MODE_DHW, MODE_POOL
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class COPQuality:
     """Quality indicator for COP measurements.
 
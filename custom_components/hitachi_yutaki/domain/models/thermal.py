@@ -4,10 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import NamedTuple
 
 
-@dataclass
-class ThermalPowerInput:
+class ThermalPowerInput(NamedTuple):
     """Input data for thermal power calculation."""
 
     water_inlet_temp: float  # °C
@@ -16,7 +16,7 @@ class ThermalPowerInput:
     is_defrosting: bool = False  # True if heat pump is in defrost mode
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ThermalEnergyResult:
     """Result of thermal energy calculation."""
 
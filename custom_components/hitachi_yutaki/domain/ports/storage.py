@@ -1,26 +1,27 @@
 """Storage port interface."""
 
-from abc import ABC, abstractmethod
-from typing import TypeVar
+from typing import Protocol
 
-T = TypeVar("T")
 
+class Storage[T](Protocol):
+    """Protocol for bounded FIFO storage of domain records."""
 
-class Storage[T](ABC):
-    """Abstract interface for data storage."""
-
-    @abstractmethod
     def append(self, item: T) -> None:
         """Add an item to the storage."""
+        ...
 
-    @abstractmethod
     def popleft(self) -> T:
         """Remove and return an item from the left side of the storage."""
+        ...
+
+    def peek_left(self) -> T | None:
+        """Return the leftmost item without removing it, or None if empty."""
+        ...
 
-    @abstractmethod
     def get_all(self) -> list[T]:
         """Return all items in the storage."""
+        ...
 
-    @abstractmethod
     def __len__(self) -> int:
         """Return the number of items in the storage."""
+        ...
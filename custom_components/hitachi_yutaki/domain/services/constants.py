@@ -0,0 +1,5 @@
+"""Constants shared by the domain services."""
+
+# Trapezoidal energy integration: a sum of (p_prev + p_curr) * seconds in kW
+# becomes kWh by halving it (trapezoid average) and dividing by 3600.
+TRAPEZOID_KW_SECONDS_TO_KWH = 0.5 / 3600
@@ -7,11 +7,15 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime, timedelta
-from time import time
+from itertools import pairwise
+from math import sumprod
+from operator import add
+from time import monotonic
 
 from ..models.cop import COPInput, COPQuality, PowerMeasurement
 from ..ports.calculators import ElectricalPowerCalculator, ThermalPowerCalculator
 from ..ports.storage import Storage
+from .constants import TRAPEZOID_KW_SECONDS_TO_KWH
 
 # Configuration constants
 COP_MEASUREMENTS_HISTORY_SIZE = 100
@@ -22,9 +26,19 @@ COP_MIN_TIME_SPAN = 5  # minutes
 COP_OPTIMAL_MEASUREMENTS = 15
 COP_OPTIMAL_TIME_SPAN = 15  # minutes
 
+# Clocks: measurement timestamps are wall-clock datetimes because they are
+# compared with recorder history, while the sampling interval is throttled on
+# monotonic() so clock adjustments cannot stall or burst measurements.
+
 
 class EnergyAccumulator:
-    """Accumulates energy measurements over time for COP calculation."""
+    """Accumulates energy measurements over time for COP calculation.
+
+    Measurements are kept in timestamp order and the trapezoidal energy
+    integrals over the stored window are maintained incrementally: each
+    append adds one trapezoid and each eviction removes one, so reading the
+    COP or its quality does not walk the history.
+    """
 
     def __init__(self, storage: Storage[PowerMeasurement], period: timedelta) -> None:
         """Initialize the accumulator.
@@ -36,12 +50,28 @@ class EnergyAccumulator:
         """
         self._storage = storage
         self.period = period
+        # Running trapezoid sums, (p1 + p2) * dt in kW.s; scaled in get_cop
+        self._thermal_sum = 0.0
+        self._electrical_sum = 0.0
+        self._first: PowerMeasurement | None = None
+        self._last: PowerMeasurement | None = None
+        # Bumped on every change to the stored window; keys the result caches
+        # so repeated reads between two measurements are served as-is.
+        self._version = 0
+        self._cop_cache: tuple[int, float | None] | None = None
+        self._quality_cache: tuple[int, COPQuality] | None = None
+        self._resync()
 
     @property
     def measurements(self) -> list[PowerMeasurement]:
         """Return all measurements from storage."""
         return self._storage.get_all()
 
+    @property
+    def version(self) -> int:
+        """Return a counter that changes whenever the stored window changes."""
+        return self._version
+
     def add_measurement(
         self,
         thermal_power: float,
@@ -51,50 +81,72 @@ class EnergyAccumulator:
     ) -> None:
         """Add a power measurement to the accumulator."""
         current_time = timestamp or datetime.now()
-        self._storage.append(
-            PowerMeasurement(current_time, thermal_power, electrical_power)
-        )
+        self._append(PowerMeasurement(current_time, thermal_power, electrical_power))
         self._prune_old_measurements(current_time)
 
-    def bulk_load(self, measurements: Iterable[PowerMeasurement]) -> None:
-        """Load multiple historical measurements."""
-        last_timestamp: datetime | None = None
-        for measurement in sorted(
-            measurements, key=lambda measurement: measurement.timestamp
-        ):
-            self._storage.append(measurement)
-            last_timestamp = measurement.timestamp
+    def bulk_load(
+        self,
+        measurements: Iterable[PowerMeasurement],
+        *,
+        assume_sorted: bool = False,
+    ) -> None:
+        """Load multiple historical measurements.
 
-        if last_timestamp is not None:
-            self._prune_old_measurements(last_timestamp)
+        Args:
+            measurements: Measurements to load
+            assume_sorted: The caller guarantees timestamp order, so the
+                measurements are streamed as they come (an iterator is never
+                materialized) instead of being sorted
 
-    def get_cop(self) -> float | None:
-        """Calculate COP from accumulated energy using trapezoidal integration."""
-        measurements = self._storage.get_all()
-        if not measurements:
-            return None
+        """
+        items = iter(
+            measurements
+            if assume_sorted
+            else sorted(measurements, key=lambda measurement: measurement.timestamp)
+        )
+        first = next(items, None)
+        if first is None:
+            return
+
+        if self._last is not None and first.timestamp < self._last.timestamp:
+            # History older than live samples already stored: merge once.
+            self._rebuild([*self._storage.get_all(), first, *items])
+        else:
+            # Stream into the bounded storage, which evicts on its own, then
+            # integrate the retained window in a single pass.
+            self._storage.append(first)
+            for measurement in items:
+                self._storage.append(measurement)
+            self._resync()
 
-        # Sort measurements by timestamp to ensure correct integration
-        measurements = sorted(measurements, key=lambda m: m.timestamp)
+        if self._last is not None:
+            self._prune_old_measurements(self._last.timestamp)
 
-        # Calculate total energy by integrating power over time
-        thermal_energy = 0.0
-        electrical_energy = 0.0
+    def get_cop(self) -> float | None:
+        """Calculate COP from accumulated energy using trapezoidal integration."""
+        cache = self._cop_cache
+        if cache is not None and cache[0] == self._version:
+            return cache[1]
+        cop_value = self._compute_cop()
+        self._cop_cache = (self._version, cop_value)
+        return cop_value
 
-        for i in range(len(measurements) - 1):
-            interval_in_seconds = (
-                measurements[i + 1].timestamp - measurements[i].timestamp
-            ).total_seconds()
-            interval_in_hours = interval_in_seconds / 3600
-            avg_thermal_power = (
-                measurements[i].thermal_power + measurements[i + 1].thermal_power
-            ) / 2
-            avg_electrical_power = (
-                measurements[i].electrical_power + measurements[i + 1].electrical_power
-            ) / 2
+    def get_quality(self) -> COPQuality:
+        """Assess the quality of the COP measurement."""
+        cache = self._quality_cache
+        if cache is not None and cache[0] == self._version:
+            return cache[1]
+        quality = self._compute_quality()
+        self._quality_cache = (self._version, quality)
+        return quality
+
+    def _compute_cop(self) -> float | None:
+        """Compute the COP of the stored window from the running sums."""
+        if self._first is None:
+            return None
 
-            thermal_energy += avg_thermal_power * interval_in_hours
-            electrical_energy += avg_electrical_power * interval_in_hours
+        thermal_energy = self._thermal_sum * TRAPEZOID_KW_SECONDS_TO_KWH
+        electrical_energy = self._electrical_sum * TRAPEZOID_KW_SECONDS_TO_KWH
 
         if electrical_energy <= 0:
             return None
@@ -114,20 +166,14 @@ class EnergyAccumulator:
 
         return cop_value
 
-    def get_quality(self) -> COPQuality:
-        """Assess the quality of the COP measurement."""
-        measurements = self.measurements
-        if not measurements:
+    def _compute_quality(self) -> COPQuality:
+        """Compute the quality assessment of the stored window."""
+        if self._first is None or self._last is None:
             return COPQuality(quality="no_data", measurements=0, time_span_minutes=0.0)
 
-        # Sort measurements by timestamp to ensure correct time span calculation
-        sorted_measurements = sorted(measurements, key=lambda m: m.timestamp)
-
-        # Calculate time span of measurements
-        time_span = (
-            sorted_measurements[-1].timestamp - sorted_measurements[0].timestamp
-        ).total_seconds() / 60
-        num_measurements = len(measurements)
+        # Measurements are stored in order: the span is last minus first
+        time_span = (self._last.timestamp - self._first.timestamp).total_seconds() / 60
+        num_measurements = len(self._storage)
 
         if num_measurements < COP_MIN_MEASUREMENTS or time_span < COP_MIN_TIME_SPAN:
             quality = "insufficient_data"
@@ -145,13 +191,95 @@ class EnergyAccumulator:
             time_span_minutes=round(time_span, 1),
         )
 
+    def _append(self, measurement: PowerMeasurement) -> None:
+        """Store a measurement and add its trapezoid to the running sums."""
+        last = self._last
+        if last is not None and measurement.timestamp < last.timestamp:
+            # Out-of-order sample: rebuild the ordered window once.
+            self._rebuild([*self._storage.get_all(), measurement])
+            return
+
+        count = len(self._storage)
+        self._storage.append(measurement)
+        if count and len(self._storage) == count:
+            # The storage dropped its oldest item to stay within capacity:
+            # retire that trapezoid too, without copying the history.
+            first = self._first
+            head = self._storage.peek_left()
+            if count == 1 or first is None or head is None:
+                # Capacity of one: the new sample is the whole window
+                self._first = self._last = measurement
+                self._version += 1
+                return
+            self._drop_trapezoid(first, head)
+            self._first = head
+
+        if last is None:
+            self._first = measurement
+        else:
+            interval = (measurement.timestamp - last.timestamp).total_seconds()
+            self._thermal_sum += (
+                last.thermal_power + measurement.thermal_power
+            ) * interval
+            self._electrical_sum += (
+                last.electrical_power + measurement.electrical_power
+            ) * interval
+        self._last = measurement
+        self._version += 1
+
+    def _drop_trapezoid(
+        self, evicted: PowerMeasurement, head: PowerMeasurement
+    ) -> None:
+        """Subtract the trapezoid between an evicted sample and the new head."""
+        interval = (head.timestamp - evicted.timestamp).total_seconds()
+        self._thermal_sum -= (evicted.thermal_power + head.thermal_power) * interval
+        self._electrical_sum -= (
+            evicted.electrical_power + head.electrical_power
+        ) * interval
+
+    def _rebuild(self, measurements: list[PowerMeasurement]) -> None:
+        """Replace the stored window with the given measurements, in order."""
+        while len(self._storage):
+            self._storage.popleft()
+        for measurement in sorted(measurements, key=lambda m: m.timestamp):
+            self._storage.append(measurement)
+        self._resync()
+
+    def _resync(self) -> None:
+        """Recompute the running sums and bounds from the stored window."""
+        measurements = self._storage.get_all()
+        # Interval lengths are computed once and shared by both integrals,
+        # each reduced to a single dot product with the pairwise power sums.
+        intervals = [
+            (current.timestamp - previous.timestamp).total_seconds()
+            for previous, current in pairwise(measurements)
+        ]
+        thermal = [m.thermal_power for m in measurements]
+        electrical = [m.electrical_power for m in measurements]
+        self._thermal_sum = sumprod(intervals, map(add, thermal, thermal[1:]))
+        self._electrical_sum = sumprod(intervals, map(add, electrical, electrical[1:]))
+        self._first = measurements[0] if measurements else None
+        self._last = measurements[-1] if measurements else None
+        self._version += 1
+
     def _prune_old_measurements(self, reference_time: datetime) -> None:
         """Remove measurements outside of the configured time period."""
         cutoff_time = reference_time - self.period
-        measurements = self._storage.get_all()
-        while measurements and measurements[0].timestamp < cutoff_time:
+        evicted = self._first
+        while evicted is not None and evicted.timestamp < cutoff_time:
             self._storage.popleft()
-            measurements = self._storage.get_all()
+            head = self._storage.peek_left()
+            if head is not None:
+                self._drop_trapezoid(evicted, head)
+            self._first = evicted = head
+            self._version += 1
+
+        if self._first is None:
+            self._last = None
+        if len(self._storage) < 2:
+            # No interval left: drop any floating-point rounding residue
+            self._thermal_sum = 0.0
+            self._electrical_sum = 0.0
 
 
 class COPService:
@@ -182,7 +310,8 @@ class COPService:
         self._thermal_calculator = thermal_calculator
         self._electrical_calculator = electrical_calculator
         self._expected_mode = expected_mode
-        self._last_measurement_time = 0.0
+        self._last_measurement_time = float("-inf")
+        self._value_cache: tuple[int, float | None] | None = None
 
     def update(self, data: COPInput) -> None:
         """Update COP calculation with new data.
@@ -200,19 +329,20 @@ class COPService:
             return
 
         # Check if enough time has passed since last measurement
-        current_time = time()
+        current_time = monotonic()
         if current_time - self._last_measurement_time < COP_MEASUREMENTS_INTERVAL:
             return
 
         # Validate input data
-        if any(
-            x is None
-            for x in [
-                data.water_inlet_temp,
-                data.water_outlet_temp,
-                data.water_flow,
-                data.compressor_current,
-            ]
+        inlet = data.water_inlet_temp
+        outlet = data.water_outlet_temp
+        flow = data.water_flow
+        compressor_current = data.compressor_current
+        if (
+            inlet is None
+            or outlet is None
+            or flow is None
+            or compressor_current is None
         ):
             # Transient missing data: do not advance the interval timer, so the
             # next complete poll within the interval is still accepted (#319).
@@ -221,33 +351,55 @@ class COPService:
         # A complete measurement is being attempted: advance the interval timer.
         self._last_measurement_time = current_time
 
-        # Calculate thermal power
-        thermal_power = self._thermal_calculator(
-            data.water_inlet_temp,  # type: ignore
-            data.water_outlet_temp,  # type: ignore
-            data.water_flow,  # type: ignore
-        )
+        powers = self._compute_power(data, inlet, outlet, flow, compressor_current)
+        if powers is not None:
+            self._accumulator.add_measurement(*powers)
+
+    def _compute_power(
+        self,
+        data: COPInput,
+        inlet: float,
+        outlet: float,
+        flow: float,
+        compressor_current: float,
+    ) -> tuple[float, float] | None:
+        """Compute the (thermal, electrical) power pair of a measurement.
+
+        Args:
+            data: Input data for the optional electrical measurements
+            inlet: Water inlet temperature in °C
+            outlet: Water outlet temperature in °C
+            flow: Water flow rate in m³/h
+            compressor_current: Primary compressor current in A
+
+        Returns:
+            Both powers in kW, or None if either is not positive
+
+        """
+        thermal_power = self._thermal_calculator(inlet, outlet, flow)
+        if thermal_power <= 0:
+            return None
 
         # Use pre-computed electrical power if available, else compute from current.
         #
         # Fallback path: call the calculator ONCE with the summed compressor
         # current. Calling it per compressor and summing would double-count when
         # the calculator returns a whole-unit measured power (issue #316).
-        if data.electrical_power is not None:
-            electrical_power = data.electrical_power
-        else:
-            total_current = data.compressor_current  # type: ignore
+        electrical_power = data.electrical_power
+        if electrical_power is None:
+            secondary_current = data.secondary_compressor_current
+            secondary_frequency = data.secondary_compressor_frequency
             if (
-                data.secondary_compressor_current is not None
-                and data.secondary_compressor_frequency is not None
-                and data.secondary_compressor_frequency > 0
+                secondary_current is not None
+                and secondary_frequency is not None
+                and secondary_frequency > 0
             ):
-                total_current += data.secondary_compressor_current
-            electrical_power = self._electrical_calculator(total_current)
+                compressor_current += secondary_current
+            electrical_power = self._electrical_calculator(compressor_current)
 
-        # Store measurement if valid
-        if thermal_power > 0 and electrical_power > 0:
-            self._accumulator.add_measurement(thermal_power, electrical_power)
+        if electrical_power <= 0:
+            return None
+        return thermal_power, electrical_power
 
     def _is_mode_matching(self, data: COPInput) -> bool:
         """Check if the current operation state matches the expected mode.
@@ -269,16 +421,27 @@ class COPService:
 
     def get_value(self) -> float | None:
         """Get current COP value rounded to 2 decimals."""
+        version = self._accumulator.version
+        cache = self._value_cache
+        if cache is not None and cache[0] == version:
+            return cache[1]
         cop = self._accumulator.get_cop()
-        return round(cop, 2) if cop is not None else None
+        value = round(cop, 2) if cop is not None else None
+        self._value_cache = (version, value)
+        return value
 
     def get_quality(self) -> COPQuality:
         """Get quality assessment of the COP measurement."""
         return self._accumulator.get_quality()
 
-    def preload_measurements(self, measurements: Iterable[PowerMeasurement]) -> None:
+    def preload_measurements(
+        self,
+        measurements: Iterable[PowerMeasurement],
+        *,
+        assume_sorted: bool = False,
+    ) -> None:
         """Preload measurements (used during Recorder replay)."""
-        self._accumulator.bulk_load(measurements)
+        self._accumulator.bulk_load(measurements, assume_sorted=assume_sorted)
 
     @staticmethod
     def _is_compressor_running(data: COPInput) -> bool:
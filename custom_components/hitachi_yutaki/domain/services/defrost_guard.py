@@ -7,7 +7,7 @@ Centralizes defrost+recovery filtering upstream of both COP and thermal services
 from __future__ import annotations
 
 from enum import Enum
-from time import time
+from time import monotonic
 
 
 class DefrostState(Enum):
@@ -18,6 +18,18 @@ class DefrostState(Enum):
     RECOVERY = "recovery"
 
 
+class _State:
+    """Internal integer codes for DefrostState (cheaper to compare than Enum)."""
+
+    NORMAL = 0
+    DEFROST = 1
+    RECOVERY = 2
+
+
+# Indexed by _State code
+_STATE_ENUMS = (DefrostState.NORMAL, DefrostState.DEFROST, DefrostState.RECOVERY)
+
+
 class DefrostGuard:
     """Guard that tracks defrost state and signals when data is unreliable.
 
@@ -50,7 +62,7 @@ class DefrostGuard:
         """
         self._stable_readings_required = stable_readings_required
         self._recovery_timeout = recovery_timeout
-        self._state = DefrostState.NORMAL
+        self._state = _State.NORMAL
         self._pre_defrost_sign: bool | None = None  # True = positive (heating)
         self._stable_count = 0
         self._recovery_start_time: float = 0.0
@@ -58,12 +70,12 @@ class DefrostGuard:
     @property
     def state(self) -> DefrostState:
         """Return the current defrost state for diagnostics."""
-        return self._state
+        return _STATE_ENUMS[self._state]
 
     @property
     def is_data_reliable(self) -> bool:
         """Return True only when state is NORMAL."""
-        return self._state == DefrostState.NORMAL
+        return self._state == _State.NORMAL
 
     def update(self, is_defrosting: bool, delta_t: float | None) -> None:
         """Update the defrost guard with fresh data.
@@ -75,42 +87,32 @@ class DefrostGuard:
             delta_t: Water outlet minus water inlet temperature, or None if unavailable
 
         """
-        if self._state == DefrostState.NORMAL:
-            self._handle_normal(is_defrosting, delta_t)
-        elif self._state == DefrostState.DEFROST:
-            self._handle_defrost(is_defrosting)
-        elif self._state == DefrostState.RECOVERY:
-            self._handle_recovery(is_defrosting, delta_t)
-
-    def _handle_normal(self, is_defrosting: bool, delta_t: float | None) -> None:
-        """Handle NORMAL state transitions."""
-        if is_defrosting:
-            # Remember ΔT sign before entering defrost
-            if delta_t is not None:
-                self._pre_defrost_sign = delta_t > 0
-            self._state = DefrostState.DEFROST
-        # Otherwise stay NORMAL — nothing to do
-
-    def _handle_defrost(self, is_defrosting: bool) -> None:
-        """Handle DEFROST state transitions."""
-        if not is_defrosting:
-            # Defrost ended, enter recovery
-            self._state = DefrostState.RECOVERY
-            self._stable_count = 0
-            self._recovery_start_time = time()
-        # Otherwise stay in DEFROST
-
-    def _handle_recovery(self, is_defrosting: bool, delta_t: float | None) -> None:
-        """Handle RECOVERY state transitions."""
-        if is_defrosting:
-            # Defrost restarted
-            self._state = DefrostState.DEFROST
-            self._stable_count = 0
-            return
+        match (self._state, bool(is_defrosting)):
+            case (_State.NORMAL, False) | (_State.DEFROST, True):
+                # Steady state — nothing to do
+                return
+            case (_State.NORMAL, True):
+                # Remember ΔT sign before entering defrost
+                if delta_t is not None:
+                    self._pre_defrost_sign = delta_t > 0
+                self._state = _State.DEFROST
+            case (_State.DEFROST, False):
+                # Defrost ended, enter recovery
+                self._state = _State.RECOVERY
+                self._stable_count = 0
+                self._recovery_start_time = monotonic()
+            case (_State.RECOVERY, True):
+                # Defrost restarted
+                self._state = _State.DEFROST
+                self._stable_count = 0
+            case (_State.RECOVERY, False):
+                self._update_recovery(delta_t)
 
+    def _update_recovery(self, delta_t: float | None) -> None:
+        """Handle RECOVERY state while the unit is not defrosting."""
         # Check safety timeout
-        if time() - self._recovery_start_time >= self._recovery_timeout:
-            self._state = DefrostState.NORMAL
+        if monotonic() - self._recovery_start_time >= self._recovery_timeout:
+            self._state = _State.NORMAL
             self._stable_count = 0
             return
 
@@ -126,7 +128,7 @@ class DefrostGuard:
         if current_sign:
             self._stable_count += 1
             if self._stable_count >= self._stable_readings_required:
-                self._state = DefrostState.NORMAL
+                self._state = _State.NORMAL
                 self._stable_count = 0
         else:
             self._stable_count = 0
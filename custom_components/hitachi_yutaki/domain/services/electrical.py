@@ -13,6 +13,13 @@ THREE_PHASE_FACTOR = 1.732
 VOLTAGE_SINGLE_PHASE = 230.0
 VOLTAGE_THREE_PHASE = 400.0
 
+# Folded per-supply factors (kW per A, and kW per V·A) so the hot path is a
+# single multiplication.
+_K_SINGLE_SCALE = POWER_FACTOR / 1000
+_K_THREE_SCALE = POWER_FACTOR * THREE_PHASE_FACTOR / 1000
+_K_VOLTAGE_SINGLE = VOLTAGE_SINGLE_PHASE * _K_SINGLE_SCALE
+_K_VOLTAGE_THREE = VOLTAGE_THREE_PHASE * _K_THREE_SCALE
+
 
 def calculate_electrical_power(data: ElectricalPowerInput) -> float:
     """Calculate electrical power in kW from input data.
@@ -34,17 +41,14 @@ def calculate_electrical_power(data: ElectricalPowerInput) -> float:
         return data.measured_power
 
     # Priority 2: Calculate from voltage and current
+    # Three phase: P = U * I * cos φ * √3, single phase: P = U * I * cos φ
     voltage = data.voltage
     if voltage is None:
-        # Use default voltage based on power supply type
-        voltage = VOLTAGE_THREE_PHASE if data.is_three_phase else VOLTAGE_SINGLE_PHASE
+        # Priority 3: default voltage based on power supply type
+        if data.is_three_phase:
+            return _K_VOLTAGE_THREE * data.current
+        return _K_VOLTAGE_SINGLE * data.current
 
-    # Calculate power based on supply type
     if data.is_three_phase:
-        # Three phase: P = U * I * cos φ * √3
-        power = (voltage * data.current * POWER_FACTOR * THREE_PHASE_FACTOR) / 1000
-    else:
-        # Single phase: P = U * I * cos φ
-        power = (voltage * data.current * POWER_FACTOR) / 1000
-
-    return power
+        return voltage * data.current * _K_THREE_SCALE
+    return voltage * data.current * _K_SINGLE_SCALE
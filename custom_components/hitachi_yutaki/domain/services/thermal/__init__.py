@@ -6,7 +6,7 @@ from .calculators import (
     calculate_thermal_power_cooling,
     calculate_thermal_power_heating,
 )
-from .constants import WATER_FLOW_TO_KGS, WATER_SPECIFIC_HEAT
+from .constants import KW_PER_M3H_PER_K, WATER_FLOW_TO_KGS, WATER_SPECIFIC_HEAT
 from .service import ThermalPowerService
 
 __all__ = [
@@ -15,6 +15,7 @@ __all__ = [
     "calculate_thermal_power",
     "calculate_thermal_power_cooling",
     "calculate_thermal_power_heating",
+    "KW_PER_M3H_PER_K",
     "WATER_FLOW_TO_KGS",
     "WATER_SPECIFIC_HEAT",
 ]
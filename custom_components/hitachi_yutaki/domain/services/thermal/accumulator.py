@@ -5,19 +5,55 @@ Pure business logic isolated from infrastructure concerns.
 
 from __future__ import annotations
 
-from datetime import date, datetime
-from time import time
+from datetime import date, datetime, timedelta
+from time import monotonic, time
 
 from ...models.operation import (
     HEATING_ONLY_MODES,
     MODE_COOLING,
     MODE_HEATING,
 )
+from ..constants import TRAPEZOID_KW_SECONDS_TO_KWH
+
+
+class _Mode:
+    """Internal integer codes for the accumulating mode (cheaper than strings)."""
+
+    NONE = 0
+    HEATING = 1
+    COOLING = 2
+
+
+# Indexed by _Mode code
+_MODE_NAMES = (None, MODE_HEATING, MODE_COOLING)
+
+
+def _next_midnight(day: date) -> float:
+    """Return the epoch timestamp of the local midnight following ``day``."""
+    return datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
 
 
 class ThermalEnergyAccumulator:
     """Accumulates thermal energy over time for heating and cooling separately."""
 
+    __slots__ = (
+        "_daily_cooling_energy",
+        "_daily_heating_energy",
+        "_daily_start_time",
+        "_last_cooling_power",
+        "_last_heating_power",
+        "_last_measurement_time",
+        "_last_mode",
+        "_last_monotonic",
+        "_last_reset",
+        "_next_reset_time",
+        "_post_cycle_lock",
+        "_total_cooling_compensation",
+        "_total_cooling_energy",
+        "_total_heating_compensation",
+        "_total_heating_energy",
+    )
+
     def __init__(
         self,
         initial_daily_heating: float = 0.0,
@@ -38,13 +74,22 @@ class ThermalEnergyAccumulator:
         self._total_heating_energy = initial_total_heating
         self._daily_cooling_energy = initial_daily_cooling
         self._total_cooling_energy = initial_total_cooling
+        # Kahan compensation terms: lifetime totals grow large while each
+        # increment stays small, so plain float sums would slowly drift.
+        self._total_heating_compensation = 0.0
+        self._total_cooling_compensation = 0.0
         self._last_heating_power = 0.0
         self._last_cooling_power = 0.0
         self._last_measurement_time = 0
+        # Intervals are measured on the monotonic clock so NTP or manual
+        # wall-clock jumps cannot produce negative or inflated energy; wall
+        # time is only used for timestamps and the midnight reset.
+        self._last_monotonic: float | None = None
         self._daily_start_time = 0
-        self._last_reset = datetime.now().date()
+        self._last_reset = date.today()
+        self._next_reset_time = _next_midnight(self._last_reset)
         self._post_cycle_lock = False
-        self._last_mode: str | None = None
+        self._last_mode = _Mode.NONE
 
     @property
     def daily_heating_energy(self) -> float:
@@ -76,6 +121,11 @@ class ThermalEnergyAccumulator:
         """Return the last effective cooling power in kW."""
         return self._last_cooling_power
 
+    @property
+    def last_mode(self) -> str | None:
+        """Return the last accumulating mode (MODE_HEATING, MODE_COOLING or None)."""
+        return _MODE_NAMES[self._last_mode]
+
     @property
     def last_measurement_time(self) -> float:
         """Return the timestamp of the last measurement."""
@@ -91,41 +141,35 @@ class ThermalEnergyAccumulator:
         """Return the date of the last daily reset."""
         return self._last_reset
 
-    def restore_daily_heating_energy(self, energy: float) -> None:
-        """Restore daily heating energy value (used after HA restart).
-
-        Args:
-            energy: Energy value to restore
-
-        """
-        self._daily_heating_energy = energy
-
-    def restore_total_heating_energy(self, energy: float) -> None:
-        """Restore total heating energy value (used after HA restart).
-
-        Args:
-            energy: Energy value to restore
-
-        """
-        self._total_heating_energy = energy
-
-    def restore_daily_cooling_energy(self, energy: float) -> None:
-        """Restore daily cooling energy value (used after HA restart).
-
-        Args:
-            energy: Energy value to restore
-
-        """
-        self._daily_cooling_energy = energy
+    def restore(
+        self,
+        *,
+        daily_heating: float | None = None,
+        total_heating: float | None = None,
+        daily_cooling: float | None = None,
+        total_cooling: float | None = None,
+    ) -> None:
+        """Restore energy counters (used after HA restart).
 
-    def restore_total_cooling_energy(self, energy: float) -> None:
-        """Restore total cooling energy value (used after HA restart).
+        Counters left as None keep their current value.
 
         Args:
-            energy: Energy value to restore
+            daily_heating: Daily heating energy value to restore
+            total_heating: Total heating energy value to restore
+            daily_cooling: Daily cooling energy value to restore
+            total_cooling: Total cooling energy value to restore
 
         """
-        self._total_cooling_energy = energy
+        if daily_heating is not None:
+            self._daily_heating_energy = daily_heating
+        if total_heating is not None:
+            self._total_heating_energy = total_heating
+            self._total_heating_compensation = 0.0
+        if daily_cooling is not None:
+            self._daily_cooling_energy = daily_cooling
+        if total_cooling is not None:
+            self._total_cooling_energy = total_cooling
+            self._total_cooling_compensation = 0.0
 
     def update(
         self,
@@ -144,6 +188,12 @@ class ThermalEnergyAccumulator:
                 MODE_DHW, MODE_POOL). DHW and pool are always heating operations.
 
         """
+        last_mode = self._last_mode
+
+        # Idle since startup: nothing to lock, accumulate or reset.
+        if last_mode == _Mode.NONE and heating_power <= 0 and cooling_power <= 0:
+            return
+
         # DHW and pool are always heating operations regardless of ΔT.
         # When the unit switches from cooling circuits to DHW, the water
         # temperature sensors may still reflect circuit temps briefly,
@@ -155,85 +205,91 @@ class ThermalEnergyAccumulator:
             heating_power = total_power
             cooling_power = 0.0
 
-        # If compressor restarts, exit post-cycle lock
+        # Post-cycle lock: once the compressor stops and delta T drops to zero
+        # in the current mode, ignore that mode's residual power until the
+        # compressor restarts.
         if compressor_running:
             self._post_cycle_lock = False
-
-        # Handle inertia and post-cycle lock (both modes)
-        if not compressor_running:
-            # Activate lock when delta T drops to zero in current mode
-            if (
-                self._last_mode == MODE_HEATING
-                and heating_power <= 0
-                or self._last_mode == MODE_COOLING
-                and cooling_power <= 0
-            ):
+        elif last_mode == _Mode.HEATING:
+            if heating_power <= 0:
+                self._post_cycle_lock = True
+            if self._post_cycle_lock:
+                heating_power = 0.0
+        elif last_mode == _Mode.COOLING:
+            if cooling_power <= 0:
                 self._post_cycle_lock = True
-
-            # When locked, force power to 0 for current mode
             if self._post_cycle_lock:
-                if self._last_mode == MODE_HEATING:
-                    heating_power = 0.0
-                elif self._last_mode == MODE_COOLING:
-                    cooling_power = 0.0
+                cooling_power = 0.0
 
         # Mode decision and accumulation
         if heating_power > 0:
-            self._update_energy(heating_power, mode=MODE_HEATING)
-            self._last_mode = MODE_HEATING
+            self._update_energy(heating_power, mode=_Mode.HEATING)
+            self._last_mode = _Mode.HEATING
             self._last_heating_power = heating_power
             self._last_cooling_power = 0.0
         elif cooling_power > 0:
             # Count cooling energy including thermal inertia after compressor stops
-            self._update_energy(cooling_power, mode=MODE_COOLING)
-            self._last_mode = MODE_COOLING
+            self._update_energy(cooling_power, mode=_Mode.COOLING)
+            self._last_mode = _Mode.COOLING
             self._last_cooling_power = cooling_power
             self._last_heating_power = 0.0
         else:
             # No significant power
             # Still advance accumulator clock with 0 kW
-            if self._last_mode is not None:
-                self._update_energy(0.0, mode=self._last_mode)
+            if last_mode != _Mode.NONE:
+                self._update_energy(0.0, mode=last_mode)
             self._last_heating_power = 0.0
             self._last_cooling_power = 0.0
 
-    def _update_energy(self, thermal_power: float, mode: str) -> None:
+    def _update_energy(self, thermal_power: float, mode: int) -> None:
         """Update energy accumulation.
 
         Args:
             thermal_power: Current thermal power in kW
-            mode: Operating mode (MODE_HEATING or MODE_COOLING)
+            mode: Accumulating mode (_Mode.HEATING or _Mode.COOLING)
 
         """
         current_time = time()
-        current_date = datetime.now().date()
+        current_monotonic = monotonic()
 
         # Initialize daily start time if not set for the current day
         if self._daily_start_time == 0:
             self._daily_start_time = current_time
 
-        # Reset daily counters at midnight
-        if current_date != self._last_reset:
+        # Reset daily counters at midnight. The next midnight is kept as an
+        # epoch so the common case is a single float comparison.
+        if current_time >= self._next_reset_time:
+            current_date = date.fromtimestamp(current_time)
             self._daily_heating_energy = 0.0
             self._daily_cooling_energy = 0.0
             self._last_reset = current_date
+            self._next_reset_time = _next_midnight(current_date)
             self._daily_start_time = current_time  # Reset start time for new day
 
         # Calculate energy since last measurement
-        if self._last_measurement_time > 0:
-            time_diff_hours = (current_time - self._last_measurement_time) / 3600
+        last_monotonic = self._last_monotonic
+        if last_monotonic is not None:
+            elapsed = current_monotonic - last_monotonic
+            scaled_interval = elapsed * TRAPEZOID_KW_SECONDS_TO_KWH
 
-            if mode == MODE_HEATING:
-                avg_power = (thermal_power + self._last_heating_power) / 2
-                energy = avg_power * time_diff_hours
+            if mode == _Mode.HEATING:
+                energy = (thermal_power + self._last_heating_power) * scaled_interval
                 self._daily_heating_energy += energy
-                self._total_heating_energy += energy
+                previous = self._total_heating_energy
+                corrected = energy - self._total_heating_compensation
+                total = previous + corrected
+                self._total_heating_compensation = (total - previous) - corrected
+                self._total_heating_energy = total
                 # Note: last power updates are handled in update() method
-            elif mode == MODE_COOLING:
-                avg_power = (thermal_power + self._last_cooling_power) / 2
-                energy = avg_power * time_diff_hours
+            elif mode == _Mode.COOLING:
+                energy = (thermal_power + self._last_cooling_power) * scaled_interval
                 self._daily_cooling_energy += energy
-                self._total_cooling_energy += energy
+                previous = self._total_cooling_energy
+                corrected = energy - self._total_cooling_compensation
+                total = previous + corrected
+                self._total_cooling_compensation = (total - previous) - corrected
+                self._total_cooling_energy = total
                 # Note: last power updates are handled in update() method
 
         self._last_measurement_time = current_time
+        self._last_monotonic = current_monotonic
@@ -6,7 +6,7 @@ Pure business logic isolated from infrastructure concerns.
 from __future__ import annotations
 
 from ...models.thermal import ThermalPowerInput
-from .constants import WATER_FLOW_TO_KGS, WATER_SPECIFIC_HEAT
+from .constants import KW_PER_M3H_PER_K
 
 
 def calculate_thermal_power(data: ThermalPowerInput) -> float:
@@ -22,11 +22,11 @@ def calculate_thermal_power(data: ThermalPowerInput) -> float:
         Signed thermal power in kW
 
     """
-    water_flow_kgs = data.water_flow * WATER_FLOW_TO_KGS
-    delta_t = data.water_outlet_temp - data.water_inlet_temp
-
-    thermal_power = water_flow_kgs * WATER_SPECIFIC_HEAT * delta_t
-    return thermal_power
+    return (
+        KW_PER_M3H_PER_K
+        * data.water_flow
+        * (data.water_outlet_temp - data.water_inlet_temp)
+    )
 
 
 def calculate_thermal_power_heating(data: ThermalPowerInput) -> float:
@@ -43,7 +43,7 @@ def calculate_thermal_power_heating(data: ThermalPowerInput) -> float:
 
     """
     thermal_power = calculate_thermal_power(data)
-    return max(0.0, thermal_power)
+    return thermal_power if thermal_power > 0.0 else 0.0
 
 
 def calculate_thermal_power_cooling(data: ThermalPowerInput) -> float:
@@ -60,4 +60,4 @@ def calculate_thermal_power_cooling(data: ThermalPowerInput) -> float:
 
     """
     thermal_power = calculate_thermal_power(data)
-    return max(0.0, -thermal_power)
+    return -thermal_power if thermal_power < 0.0 else 0.0
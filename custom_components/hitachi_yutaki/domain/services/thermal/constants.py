@@ -3,3 +3,6 @@
 # Constants for thermal calculations
 WATER_FLOW_TO_KGS = 0.277778  # 1 m³/h = 1000 L/h = 1000 kg/h = 0.277778 kg/s
 WATER_SPECIFIC_HEAT = 4.185  # kJ/kg·K
+
+# Thermal power per unit of flow and temperature difference, kW per (m³/h · K)
+KW_PER_M3H_PER_K = WATER_FLOW_TO_KGS * WATER_SPECIFIC_HEAT
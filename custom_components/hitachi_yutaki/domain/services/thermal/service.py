@@ -5,12 +5,8 @@ Pure business logic isolated from infrastructure concerns.
 
 from __future__ import annotations
 
-from ...models.thermal import ThermalPowerInput
 from .accumulator import ThermalEnergyAccumulator
-from .calculators import (
-    calculate_thermal_power_cooling,
-    calculate_thermal_power_heating,
-)
+from .constants import KW_PER_M3H_PER_K
 
 
 class ThermalPowerService:
@@ -20,6 +16,8 @@ class ThermalPowerService:
     Separates heating (ΔT > 0) and cooling (ΔT < 0) energy.
     """
 
+    __slots__ = ("_accumulator",)
+
     def __init__(self, accumulator: ThermalEnergyAccumulator) -> None:
         """Initialize the thermal power service.
 
@@ -54,7 +52,7 @@ class ThermalPowerService:
         )
 
         # Validate input data
-        if any(x is None for x in [water_inlet_temp, water_outlet_temp, water_flow]):
+        if water_inlet_temp is None or water_outlet_temp is None or water_flow is None:
             self._accumulator.update(
                 heating_power=0.0,
                 cooling_power=0.0,
@@ -63,14 +61,11 @@ class ThermalPowerService:
             )
             return
 
-        # Power calculation (pure calculation, no business logic)
-        thermal_input = ThermalPowerInput(
-            water_inlet_temp,  # type: ignore
-            water_outlet_temp,  # type: ignore
-            water_flow,  # type: ignore
-        )
-        heating_power = calculate_thermal_power_heating(thermal_input)
-        cooling_power = calculate_thermal_power_cooling(thermal_input)
+        # Power calculation (same formula as calculate_thermal_power), split
+        # by sign into heating and cooling
+        power = KW_PER_M3H_PER_K * water_flow * (water_outlet_temp - water_inlet_temp)
+        heating_power = power if power > 0 else 0.0
+        cooling_power = -power if power < 0 else 0.0
 
         # Delegate all logic to accumulator
         self._accumulator.update(
@@ -104,38 +99,26 @@ class ThermalPowerService:
         """Get total cooling energy in kWh."""
         return round(self._accumulator.total_cooling_energy, 2)
 
-    def restore_daily_heating_energy(self, energy: float) -> None:
-        """Restore daily heating energy state (used after HA restart).
-
-        Args:
-            energy: Energy value to restore
-
-        """
-        self._accumulator.restore_daily_heating_energy(energy)
-
-    def restore_total_heating_energy(self, energy: float) -> None:
-        """Restore total heating energy state (used after HA restart).
-
-        Args:
-            energy: Energy value to restore
-
-        """
-        self._accumulator.restore_total_heating_energy(energy)
-
-    def restore_daily_cooling_energy(self, energy: float) -> None:
-        """Restore daily cooling energy state (used after HA restart).
-
-        Args:
-            energy: Energy value to restore
-
-        """
-        self._accumulator.restore_daily_cooling_energy(energy)
-
-    def restore_total_cooling_energy(self, energy: float) -> None:
-        """Restore total cooling energy state (used after HA restart).
+    def restore(
+        self,
+        *,
+        daily_heating: float | None = None,
+        total_heating: float | None = None,
+        daily_cooling: float | None = None,
+        total_cooling: float | None = None,
+    ) -> None:
+        """Restore energy state (used after HA restart).
 
         Args:
-            energy: Energy value to restore
+            daily_heating: Daily heating energy value to restore
+            total_heating: Total heating energy value to restore
+            daily_cooling: Daily cooling energy value to restore
+            total_cooling: Total cooling energy value to restore
 
         """
-        self._accumulator.restore_total_cooling_energy(energy)
+        self._accumulator.restore(
+            daily_heating=daily_heating,
+            total_heating=total_heating,
+            daily_cooling=daily_cooling,
+            total_cooling=total_cooling,
+        )
@@ -5,6 +5,7 @@ Pure business logic isolated from infrastructure concerns.
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Iterable
 from datetime import datetime
 
@@ -12,9 +13,29 @@ from ..models.timing import CompressorTimingResult
 from ..ports.storage import Storage
 
 
+def _push(window: deque[float], value: float) -> float:
+    """Append to a bounded window and return the value it evicted (0.0 if none)."""
+    evicted = window[0] if window and len(window) == window.maxlen else 0.0
+    window.append(value)
+    return evicted
+
+
 class CompressorHistory:
     """Tracks compressor state history for timing calculations."""
 
+    __slots__ = (
+        "_cycles",
+        "_cycles_sum",
+        "_last_record",
+        "_last_running_ts",
+        "_rest_sum",
+        "_rest_times",
+        "_run_sum",
+        "_run_times",
+        "_storage",
+        "max_history",
+    )
+
     def __init__(
         self, storage: Storage[tuple[datetime, bool]], max_history: int
     ) -> None:
@@ -27,9 +48,20 @@ class CompressorHistory:
         """
         self._storage = storage
         self.max_history = max_history
-        self._cycles: list[float] = []  # minutes
-        self._run_times: list[float] = []  # minutes
-        self._rest_times: list[float] = []  # minutes
+        self._cycles: deque[float] = deque(maxlen=max_history)  # minutes
+        self._run_times: deque[float] = deque(maxlen=max_history)  # minutes
+        self._rest_times: deque[float] = deque(maxlen=max_history)  # minutes
+        # Running totals of the windows above, so averages are O(1) to read
+        self._cycles_sum = 0.0
+        self._run_sum = 0.0
+        self._rest_sum = 0.0
+        # Latest stored state and latest running start, tracked on append so
+        # updates never read the history back from storage
+        stored = storage.get_all()
+        self._last_record: tuple[datetime, bool] | None = stored[-1] if stored else None
+        self._last_running_ts: datetime | None = next(
+            (time for time, state in reversed(stored) if state), None
+        )
 
     def add_state(self, is_running: bool, timestamp: datetime | None = None) -> None:
         """Add a new compressor state to history.
@@ -40,61 +72,64 @@ class CompressorHistory:
 
         """
         now = timestamp or datetime.now()
-        states = self._storage.get_all()
-
-        # If we have a previous state
-        if states:
-            last_time, last_state = states[-1]
-
-            # Only add if state changed
-            if last_state != is_running:
-                duration = (now - last_time).total_seconds() / 60  # Convert to minutes
-
-                # A negative duration means the incoming timestamp predates the
-                # last recorded one. This happens when Recorder-replayed states
-                # (local wall-clock) interleave with live ``datetime.now()``
-                # readings across a clock/DST shift. Such a value is physically
-                # impossible, so record the transition but skip the bogus
-                # duration to keep averages sane (issue #365).
-                is_valid_duration = duration >= 0
-
-                # Calculate times based on the state change
-                if is_running:  # Changing from off to on
-                    if is_valid_duration and len(states) >= 2:  # complete cycle
-                        cycle_start = next(
-                            (
-                                time for time, state in reversed(states[:-1]) if state
-                            ),  # Find last running state
-                            None,
-                        )
-                        if cycle_start:
-                            cycle_time = (now - cycle_start).total_seconds() / 60
-                            if cycle_time >= 0:
-                                self._cycles.append(cycle_time)
-                    if is_valid_duration:
-                        self._rest_times.append(duration)
-                elif is_valid_duration:  # Changing from on to off
-                    self._run_times.append(duration)
-
-                # Add the new state
-                self._storage.append((now, is_running))
-
-                # Trim timing lists
-                if len(self._cycles) > self.max_history:
-                    self._cycles.pop(0)
-                if len(self._run_times) > self.max_history:
-                    self._run_times.pop(0)
-                if len(self._rest_times) > self.max_history:
-                    self._rest_times.pop(0)
-        else:
-            # First state
-            self._storage.append((now, is_running))
+        last = self._last_record
+
+        # Only add the first state or a state change
+        if last is not None:
+            if last[1] == is_running:
+                return
+            # Off to on closes a cycle started by the last running state
+            self._record_transition(
+                last[0], self._last_running_ts if is_running else None, now, is_running
+            )
+
+        self._storage.append((now, is_running))
+        self._last_record = (now, is_running)
+        if is_running:
+            self._last_running_ts = now
 
     def bulk_load(self, states: Iterable[tuple[datetime, bool]]) -> None:
         """Load historical compressor states."""
         for timestamp, is_running in sorted(states, key=lambda state: state[0]):
             self.add_state(is_running, timestamp=timestamp)
 
+    def _record_transition(
+        self,
+        last_time: datetime,
+        cycle_start: datetime | None,
+        now: datetime,
+        is_running: bool,
+    ) -> None:
+        """Record the timings closed by a state change.
+
+        Args:
+            last_time: Timestamp of the previous (opposite) state
+            cycle_start: Start of the previous run, for an off to on change
+            now: Timestamp of the new state
+            is_running: The new state
+
+        """
+        duration = (now - last_time).total_seconds() / 60  # Convert to minutes
+
+        # A negative duration means the incoming timestamp predates the
+        # last recorded one. This happens when Recorder-replayed states
+        # (local wall-clock) interleave with live ``datetime.now()``
+        # readings across a clock/DST shift. Such a value is physically
+        # impossible, so record the transition but skip the bogus
+        # duration to keep averages sane (issue #365).
+        if duration < 0:
+            return
+
+        # Calculate times based on the state change
+        if is_running:  # Changing from off to on
+            if cycle_start is not None:  # complete cycle
+                cycle_time = (now - cycle_start).total_seconds() / 60
+                if cycle_time >= 0:
+                    self._cycles_sum += cycle_time - _push(self._cycles, cycle_time)
+            self._rest_sum += duration - _push(self._rest_times, duration)
+        else:  # Changing from on to off
+            self._run_sum += duration - _push(self._run_times, duration)
+
     def get_average_times(self) -> tuple[float | None, float | None, float | None]:
         """Get average cycle, run and rest times.
 
@@ -102,13 +137,9 @@ class CompressorHistory:
             Tuple of (average_cycle_time, average_runtime, average_resttime) in minutes
 
         """
-        avg_cycle = sum(self._cycles) / len(self._cycles) if self._cycles else None
-        avg_run = (
-            sum(self._run_times) / len(self._run_times) if self._run_times else None
-        )
-        avg_rest = (
-            sum(self._rest_times) / len(self._rest_times) if self._rest_times else None
-        )
+        avg_cycle = self._cycles_sum / len(self._cycles) if self._cycles else None
+        avg_run = self._run_sum / len(self._run_times) if self._run_times else None
+        avg_rest = self._rest_sum / len(self._rest_times) if self._rest_times else None
         return avg_cycle, avg_run, avg_rest
 
     def clear(self) -> None:
@@ -118,6 +149,9 @@ class CompressorHistory:
         self._cycles.clear()
         self._run_times.clear()
         self._rest_times.clear()
+        self._cycles_sum = 0.0
+        self._run_sum = 0.0
+        self._rest_sum = 0.0
 
 
 class CompressorTimingService:
@@ -126,6 +160,8 @@ class CompressorTimingService:
     This service is independent of Home Assistant and can be easily tested.
     """
 
+    __slots__ = ("_history",)
+
     def __init__(self, history: CompressorHistory) -> None:
         """Initialize the compressor timing service.
 
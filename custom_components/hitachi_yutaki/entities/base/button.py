@@ -13,6 +13,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ...coordinator import HitachiYutakiDataCoordinator
+from .unique_id import _unique_id_prefix
 
 
 @dataclass
@@ -41,30 +42,20 @@ class HitachiYutakiButton(
         coordinator: HitachiYutakiDataCoordinator,
         description: HitachiYutakiButtonEntityDescription,
         device_info: DeviceInfo,
-        register_prefix: str | None = None,
+        uid_prefix: str,
     ) -> None:
         """Initialize the button."""
         super().__init__(coordinator)
         self.entity_description = description
-        entry_id = coordinator.config_entry.entry_id
-        self._attr_unique_id = (
-            f"{entry_id}_{register_prefix}_{description.key}"
-            if register_prefix
-            else f"{entry_id}_{description.key}"
-        )
+        self._attr_unique_id = uid_prefix + description.key
         self._attr_device_info = device_info
         self._attr_has_entity_name = True
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
-
     async def async_press(self) -> None:
         """Handle the button press."""
-        if self.entity_description.action_fn:
-            await self.entity_description.action_fn(self.coordinator)
-            await self.coordinator.async_request_refresh()
+        # _create_buttons only creates buttons that have an action
+        await self.entity_description.action_fn(self.coordinator)
+        await self.coordinator.async_request_refresh()
 
 
 def _create_buttons(
@@ -74,17 +65,22 @@ def _create_buttons(
     device_type: DEVICE_TYPES,
     register_prefix: str | None = None,
 ) -> list[HitachiYutakiButton]:
-    """Create button entities from descriptions."""
+    """Create button entities from descriptions.
+
+    Descriptions without an action_fn could never fire and are skipped.
+    """
     device_info = DeviceInfo(
         identifiers={(DOMAIN, f"{entry_id}_{device_type}")},
     )
+    uid_prefix = _unique_id_prefix(entry_id, register_prefix)
 
     return [
         HitachiYutakiButton(
             coordinator=coordinator,
             description=description,
             device_info=device_info,
-            register_prefix=register_prefix,
+            uid_prefix=uid_prefix,
         )
         for description in descriptions
+        if description.action_fn is not None
     ]
@@ -21,8 +21,6 @@ from ...const import (
     CIRCUIT_IDS,
     CIRCUIT_MODE_COOLING,
     CIRCUIT_MODE_HEATING,
-    CIRCUIT_PRIMARY_ID,
-    CIRCUIT_SECONDARY_ID,
     PRESET_COMFORT,
 )
 from ...coordinator import HitachiYutakiDataCoordinator
@@ -44,6 +42,14 @@ class HitachiYutakiClimate(
 
     entity_description: HitachiYutakiClimateEntityDescription
 
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.PRESET_MODE
+        | ClimateEntityFeature.TURN_ON
+        | ClimateEntityFeature.TURN_OFF
+    )
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+
     def __init__(
         self,
         coordinator: HitachiYutakiDataCoordinator,
@@ -63,20 +69,15 @@ class HitachiYutakiClimate(
         self._attr_device_info = device_info
         self._attr_has_entity_name = True
 
-        # Set supported features
-        self._attr_supported_features = (
-            ClimateEntityFeature.TARGET_TEMPERATURE
-            | ClimateEntityFeature.PRESET_MODE
-            | ClimateEntityFeature.TURN_ON
-            | ClimateEntityFeature.TURN_OFF
-        )
-
         # Set temperature settings
         climate_overrides = coordinator.profile.entity_overrides.get("climate", {})
         self._attr_min_temp = climate_overrides.get("min_temp", 5.0)
         self._attr_max_temp = climate_overrides.get("max_temp", 35.0)
         self._attr_target_temperature_step = climate_overrides.get("temp_step", 0.5)
-        self._attr_temperature_unit = UnitOfTemperature.CELSIUS
+
+        # Circuit capabilities, resolved once (system_config is cached)
+        self._has_heat = coordinator.has_circuit(circuit_id, CIRCUIT_MODE_HEATING)
+        self._has_cool = coordinator.has_circuit(circuit_id, CIRCUIT_MODE_COOLING)
 
         # Set available modes
         if multi_circuit:
@@ -86,17 +87,9 @@ class HitachiYutakiClimate(
         else:
             # Single circuit: full mode control
             self._attr_hvac_modes = [HVACMode.OFF]
-            if (
-                coordinator.has_circuit(CIRCUIT_PRIMARY_ID, CIRCUIT_MODE_HEATING)
-                if circuit_id == CIRCUIT_PRIMARY_ID
-                else coordinator.has_circuit(CIRCUIT_SECONDARY_ID, CIRCUIT_MODE_HEATING)
-            ):
+            if self._has_heat:
                 self._attr_hvac_modes.append(HVACMode.HEAT)
-            if (
-                coordinator.has_circuit(CIRCUIT_PRIMARY_ID, CIRCUIT_MODE_COOLING)
-                if circuit_id == CIRCUIT_PRIMARY_ID
-                else coordinator.has_circuit(CIRCUIT_SECONDARY_ID, CIRCUIT_MODE_COOLING)
-            ):
+            if self._has_cool:
                 self._attr_hvac_modes.append(HVACMode.COOL)
             if (
                 len(self._attr_hvac_modes) > 2
@@ -112,11 +105,6 @@ class HitachiYutakiClimate(
         ):
             self._attr_preset_modes.append(PRESET_ECO)
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
-
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
@@ -155,21 +143,22 @@ class HitachiYutakiClimate(
     @property
     def hvac_action(self) -> HVACAction | None:
         """Return the current running hvac operation."""
-        if self.hvac_mode == HVACAction.OFF:
-            return HVACAction.OFF
-
         if self.coordinator.data is None:
             return None
 
+        api_client = self.coordinator.api_client
+        if not api_client.get_circuit_power(self._circuit_id):
+            return HVACAction.OFF
+
         # Check if in defrost mode
-        if self.coordinator.api_client.is_defrosting:
+        if api_client.is_defrosting:
             return HVACAction.DEFROSTING
 
         # Check if compressor is running
-        if not self.coordinator.api_client.is_compressor_running:
+        if not api_client.is_compressor_running:
             return HVACAction.IDLE
 
-        hvac_mode = self.coordinator.api_client.get_unit_mode()
+        hvac_mode = api_client.get_unit_mode()
         if hvac_mode == HVACMode.COOL:
             return HVACAction.COOLING
         if hvac_mode == HVACMode.HEAT:
@@ -179,9 +168,7 @@ class HitachiYutakiClimate(
         # running direction from the STATUS operation_state register so the card
         # shows heating/cooling instead of "unknown".
         if hvac_mode == HVACMode.AUTO:
-            operation_mode = resolve_operation_mode(
-                self.coordinator.api_client.get_operation_state()
-            )
+            operation_mode = resolve_operation_mode(api_client.get_operation_state())
             if operation_mode == MODE_HEATING:
                 return HVACAction.HEATING
             if operation_mode == MODE_COOLING:
@@ -253,9 +240,7 @@ class HitachiYutakiClimate(
             await self.async_set_hvac_mode(HVACMode.HEAT_COOL)
         else:
             await self.async_set_hvac_mode(
-                HVACMode.HEAT
-                if HVACMode.HEAT in self._attr_hvac_modes
-                else HVACMode.COOL
+                HVACMode.HEAT if self._has_heat else HVACMode.COOL
             )
 
     async def async_turn_off(self) -> None:
@@ -264,10 +249,10 @@ class HitachiYutakiClimate(
 
     async def async_toggle(self) -> None:
         """Toggle the entity."""
-        if self.hvac_mode == HVACMode.OFF:
-            await self.async_turn_on()
-        else:
+        if self.coordinator.api_client.get_circuit_power(self._circuit_id):
             await self.async_turn_off()
+        else:
+            await self.async_turn_on()
 
     def set_humidity(self, humidity: int) -> None:
         """Set new target humidity."""
@@ -15,11 +15,12 @@ from homeassistant.const import EntityCategory
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ...const import DEVICE_TYPES, DOMAIN
+from ...const import CIRCUIT_ID_BY_PREFIX, DEVICE_TYPES, DOMAIN
 from ...coordinator import HitachiYutakiDataCoordinator
+from .unique_id import _unique_id_prefix
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class HitachiYutakiNumberEntityDescription(NumberEntityDescription):
     """Class describing Hitachi Yutaki number entities."""
 
@@ -63,6 +64,11 @@ def _create_numbers(
         List of created number entities
 
     """
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, f"{entry_id}_{device_type}")},
+    )
+    uid_prefix = _unique_id_prefix(entry_id, register_prefix)
+
     entities = []
     for description in descriptions:
         # Skip entities that don't meet their condition
@@ -72,9 +78,8 @@ def _create_numbers(
             HitachiYutakiNumber(
                 coordinator=coordinator,
                 description=description,
-                device_info=DeviceInfo(
-                    identifiers={(DOMAIN, f"{entry_id}_{device_type}")},
-                ),
+                device_info=device_info,
+                uid_prefix=uid_prefix,
                 register_prefix=register_prefix,
             )
         )
@@ -93,31 +98,17 @@ class HitachiYutakiNumber(
         coordinator: HitachiYutakiDataCoordinator,
         description: HitachiYutakiNumberEntityDescription,
         device_info: DeviceInfo,
+        uid_prefix: str,
         register_prefix: str | None = None,
     ) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator)
         self.entity_description = description
-        entry_id = coordinator.config_entry.entry_id
-        self._attr_unique_id = (
-            f"{entry_id}_{register_prefix}_{description.key}"
-            if register_prefix
-            else f"{entry_id}_{description.key}"
-        )
+        self._attr_unique_id = uid_prefix + description.key
         self._attr_device_info = device_info
         self._attr_has_entity_name = True
 
-        # Extract circuit_id if applicable
-        self._circuit_id = (
-            int(register_prefix.replace("circuit", ""))
-            if register_prefix and register_prefix.startswith("circuit")
-            else None
-        )
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
+        self._circuit_id = CIRCUIT_ID_BY_PREFIX.get(register_prefix)
 
     @property
     def native_value(self) -> float | None:
@@ -6,16 +6,21 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
-from custom_components.hitachi_yutaki.const import DEVICE_TYPES, DOMAIN
+from custom_components.hitachi_yutaki.const import (
+    CIRCUIT_ID_BY_PREFIX,
+    DEVICE_TYPES,
+    DOMAIN,
+)
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.const import EntityCategory
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ...coordinator import HitachiYutakiDataCoordinator
+from .unique_id import _unique_id_prefix
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class HitachiYutakiSelectEntityDescription(SelectEntityDescription):
     """Class describing Hitachi Yutaki select entities."""
 
@@ -43,31 +48,24 @@ class HitachiYutakiSelect(
         coordinator: HitachiYutakiDataCoordinator,
         description: HitachiYutakiSelectEntityDescription,
         device_info: DeviceInfo,
+        uid_prefix: str,
         register_prefix: str | None = None,
     ) -> None:
         """Initialize the select."""
         super().__init__(coordinator)
         self.entity_description = description
-        entry_id = coordinator.config_entry.entry_id
-        self._attr_unique_id = (
-            f"{entry_id}_{register_prefix}_{description.key}"
-            if register_prefix
-            else f"{entry_id}_{description.key}"
-        )
+        self._attr_unique_id = uid_prefix + description.key
         self._attr_device_info = device_info
         self._attr_has_entity_name = True
 
-        # Extract circuit_id if applicable
-        self._circuit_id = (
-            int(register_prefix.replace("circuit", ""))
-            if register_prefix and register_prefix.startswith("circuit")
-            else None
+        # Reverse of value_map so current_option is a single dict lookup
+        self._option_by_value = (
+            {value: option for option, value in description.value_map.items()}
+            if description.value_map
+            else {}
         )
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
+        self._circuit_id = CIRCUIT_ID_BY_PREFIX.get(register_prefix)
 
     @property
     def current_option(self) -> str | None:
@@ -86,10 +84,7 @@ class HitachiYutakiSelect(
         if value is None:
             return None
 
-        return next(
-            (k for k, v in self.entity_description.value_map.items() if v == value),
-            None,
-        )
+        return self._option_by_value.get(value)
 
     def select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -123,6 +118,7 @@ def _create_selects(
     device_info = DeviceInfo(
         identifiers={(DOMAIN, f"{entry_id}_{device_type}")},
     )
+    uid_prefix = _unique_id_prefix(entry_id, register_prefix)
 
     for description in descriptions:
         if description.condition and not description.condition(coordinator):
@@ -133,6 +129,7 @@ def _create_selects(
                 coordinator=coordinator,
                 description=description,
                 device_info=device_info,
+                uid_prefix=uid_prefix,
                 register_prefix=register_prefix,
             )
         )
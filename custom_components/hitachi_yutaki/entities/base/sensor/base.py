@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from contextlib import suppress
 from dataclasses import dataclass
 import logging
 from typing import Any
@@ -14,7 +13,6 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import StateType
@@ -29,7 +27,7 @@ from ....coordinator import HitachiYutakiDataCoordinator
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, kw_only=True)
 class HitachiYutakiSensorEntityDescription(SensorEntityDescription):
     """Class describing Hitachi Yutaki sensor entities."""
 
@@ -68,6 +66,9 @@ def _create_sensors(
         List of created sensor entities
 
     """
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, f"{entry_id}_{device_type}")},
+    )
     sensors: list[HitachiYutakiSensor] = []
     for description in descriptions:
         if description.condition is not None and not description.condition(coordinator):
@@ -77,9 +78,7 @@ def _create_sensors(
             HitachiYutakiSensor(
                 coordinator=coordinator,
                 description=description,
-                device_info=DeviceInfo(
-                    identifiers={(DOMAIN, f"{entry_id}_{device_type}")},
-                ),
+                device_info=device_info,
             )
         )
 
@@ -104,27 +103,13 @@ class HitachiYutakiSensor(
         self._attr_unique_id = f"{entry_id}_{description.key}"
         self._attr_device_info = device_info
         self._attr_has_entity_name = True
+        # Key-specific attribute builder, resolved once (None for most sensors)
+        self._key_attributes_fn = self._KEY_ATTRIBUTES_FNS.get(description.key)
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
         await super().async_added_to_hass()
 
-    def _get_temperature(self, entity_key: str, fallback_key: str) -> float | None:
-        """Get temperature from a configured entity, falling back to coordinator data."""
-        entity_id = self.coordinator.config_entry.data.get(entity_key)
-        if entity_id:
-            state = self.hass.states.get(entity_id)
-            if state and state.state not in (None, "unknown", "unavailable"):
-                with suppress(ValueError):
-                    return float(state.state)
-        return self.coordinator.data.get(fallback_key)
-
-    def _resolve_entity_id(self, platform_domain: str, key: str) -> str | None:
-        """Return the entity_id registered for the provided (domain, unique_id)."""
-        registry = er.async_get(self.hass)
-        unique_id = f"{self.coordinator.config_entry.entry_id}_{key}"
-        return registry.async_get_entity_id(platform_domain, DOMAIN, unique_id)
-
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
@@ -159,18 +144,20 @@ class HitachiYutakiSensor(
             return {"code": code}
         return None
 
+    _KEY_ATTRIBUTES_FNS: dict[
+        str, Callable[[HitachiYutakiSensor], dict[str, Any] | None]
+    ] = {
+        "alarm": _get_alarm_attributes,
+        "operation_state": _get_operation_state_attributes,
+    }
+
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return the state attributes of the sensor."""
         if self.entity_description.attributes_fn is not None:
             return self.entity_description.attributes_fn(self.coordinator)
 
-        key = self.entity_description.key
-
-        # Dispatch attributes based on sensor key
-        if key == "alarm":
-            return self._get_alarm_attributes()
-        elif key == "operation_state":
-            return self._get_operation_state_attributes()
+        if self._key_attributes_fn is not None:
+            return self._key_attributes_fn(self)
 
         return None
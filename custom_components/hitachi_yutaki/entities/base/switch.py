@@ -9,7 +9,7 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from ...const import DEVICE_TYPES, DOMAIN
+from ...const import CIRCUIT_ID_BY_PREFIX, DEVICE_TYPES, DOMAIN
 from ...coordinator import HitachiYutakiDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,6 +47,7 @@ class HitachiYutakiSwitch(CoordinatorEntity, SwitchEntity):
         self._description = description
         self._device_info = device_info
         self._register_prefix = register_prefix
+        self._circuit_id = CIRCUIT_ID_BY_PREFIX.get(register_prefix)
 
         # Set unique_id
         entry_id = coordinator.config_entry.entry_id
@@ -77,20 +78,10 @@ class HitachiYutakiSwitch(CoordinatorEntity, SwitchEntity):
         """Return device information."""
         return self._device_info
 
-    def _get_circuit_id(self) -> int | None:
-        """Extract circuit ID from register prefix."""
-        if self._register_prefix and self._register_prefix.startswith("circuit"):
-            try:
-                return int(self._register_prefix.replace("circuit", ""))
-            except ValueError:
-                pass
-        return None
-
     @property
     def is_on(self) -> bool | None:
         """Return if the switch is on."""
-        circuit_id = self._get_circuit_id()
-        return self._description.get_fn(self._coordinator.api_client, circuit_id)
+        return self._description.get_fn(self._coordinator.api_client, self._circuit_id)
 
     @property
     def _register_key(self) -> str:
@@ -107,9 +98,8 @@ class HitachiYutakiSwitch(CoordinatorEntity, SwitchEntity):
         the real device state. On success we also request a refresh because
         ``is_on`` reads from the live ``api_client`` (not ``coordinator.data``).
         """
-        circuit_id = self._get_circuit_id()
         success = await self._description.set_fn(
-            self._coordinator.api_client, circuit_id, value
+            self._coordinator.api_client, self._circuit_id, value
         )
 
         if not success:
@@ -0,0 +1,14 @@
+"""Unique ID helpers shared by the base entity builders."""
+
+from __future__ import annotations
+
+
+def _unique_id_prefix(entry_id: str, register_prefix: str | None = None) -> str:
+    """Return the unique ID prefix an entity's description key is appended to.
+
+    Entities bound to a register prefix (circuit1, dhw, ...) are namespaced
+    by it; the others only by the config entry.
+    """
+    if register_prefix:
+        return f"{entry_id}_{register_prefix}_"
+    return f"{entry_id}_"
@@ -18,6 +18,13 @@ if TYPE_CHECKING:
 class HitachiYutakiTelemetrySensor(HitachiYutakiSensor):
     """Telemetry diagnostic sensor with telemetry-specific attributes."""
 
+    async def async_added_to_hass(self) -> None:
+        """Also follow telemetry changes that poll data does not reflect."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_telemetry_listener(self.async_write_ha_state)
+        )
+
     @property
     def native_value(self) -> StateType:
         """Return the telemetry level."""
@@ -95,6 +95,37 @@ class TestThermalPower:
         adapter_cool.update(data2)
         assert "thermal_power_cooling" in data2
 
+    def test_external_water_temps_read_once_per_update(self):
+        """Configured inlet/outlet entities are read once and feed both metrics."""
+        inlet_state = MagicMock()
+        inlet_state.state = "25.0"
+        outlet_state = MagicMock()
+        outlet_state.state = "35.0"
+        states = {"sensor.inlet": inlet_state, "sensor.outlet": outlet_state}
+
+        mock_hass = MagicMock()
+        mock_hass.states.get = MagicMock(side_effect=states.get)
+        config_entry = MagicMock()
+        config_entry.data = {
+            "water_inlet_temp_entity": "sensor.inlet",
+            "water_outlet_temp_entity": "sensor.outlet",
+        }
+        adapter = DerivedMetricsAdapter(
+            hass=mock_hass, config_entry=config_entry, power_supply="single"
+        )
+
+        data = _sample_data()
+        adapter.update(data)
+
+        reads = [call.args[0] for call in mock_hass.states.get.call_args_list]
+        assert reads.count("sensor.inlet") == 1
+        assert reads.count("sensor.outlet") == 1
+        # Delta T of 10 K from the external sensors, not 5 K from Modbus
+        reference = _make_adapter()
+        reference_data = _sample_data(water_inlet_temp=25.0)
+        reference.update(reference_data)
+        assert data["thermal_power_heating"] == reference_data["thermal_power_heating"]
+
 
 class TestCoordinatorIntegration:
     """Tests for adapter integration with coordinator data flow."""
@@ -237,6 +268,17 @@ class TestCOP:
         adapter._init_cop_services(has_cooling=True, has_dhw=False, has_pool=False)
         assert "cop_cooling" in adapter._cop_services
 
+    def test_cop_accepted_states_resolved_per_service(self):
+        """Each COP service gets its replay operation-state filter at init."""
+        adapter = _make_adapter(has_cooling=True)
+        assert adapter._cop_accepted_states.keys() == adapter._cop_services.keys()
+        assert adapter._cop_accepted_states["cop_heating"] == frozenset(
+            {"operation_state_heat_thermo_on"}
+        )
+        assert adapter._cop_accepted_states["cop_cooling"] == frozenset(
+            {"operation_state_cool_thermo_on"}
+        )
+
 
 class TestTiming:
     """Tests for compressor timing enrichment."""
@@ -18,6 +18,12 @@ from custom_components.hitachi_yutaki.api.modbus.registers.atw_mbs_02 import (
 from custom_components.hitachi_yutaki.api.modbus.registers.atw_mbs_02_pre2016 import (
     AtwMbs02Pre2016RegisterMap,
 )
+from custom_components.hitachi_yutaki.const import (
+    CIRCUIT_MODE_COOLING,
+    CIRCUIT_MODE_HEATING,
+    CIRCUIT_PRIMARY_ID,
+    CIRCUIT_SECONDARY_ID,
+)
 
 
 @pytest.fixture
@@ -44,6 +50,7 @@ def api_client(mock_hass, mock_client):
         api._hass = mock_hass
         api._client = mock_client
         api._slave = 1
+        api._device_kwargs = {"slave": 1}
         return api
 
 
@@ -261,43 +268,37 @@ def _make_modbus_error():
     return result
 
 
-@pytest.mark.asyncio
-async def test_read_register_returns_deserialized_value(api_client, mock_client):
-    """Test _read_register returns deserialized value on success."""
+def test_read_register_returns_deserialized_value(api_client, mock_client):
+    """Test _read_register_blocking returns deserialized value on success."""
     mock_client.read_holding_registers.return_value = _make_modbus_result(350)
     definition = RegisterDefinition(1200, deserializer=lambda v: v / 10.0)
 
-    value = await api_client._read_register(definition, "slave")
+    value = api_client._read_register_blocking(definition)
 
     assert value == 35.0
 
 
-@pytest.mark.asyncio
-async def test_read_register_returns_raw_value_without_deserializer(
-    api_client, mock_client
-):
-    """Test _read_register returns raw value when no deserializer is set."""
+def test_read_register_returns_raw_value_without_deserializer(api_client, mock_client):
+    """Test _read_register_blocking returns raw value when no deserializer is set."""
     mock_client.read_holding_registers.return_value = _make_modbus_result(42)
     definition = RegisterDefinition(1000)
 
-    value = await api_client._read_register(definition, "slave")
+    value = api_client._read_register_blocking(definition)
 
     assert value == 42
 
 
-@pytest.mark.asyncio
-async def test_read_register_returns_none_on_error(api_client, mock_client):
-    """Test _read_register returns None on Modbus read error."""
+def test_read_register_returns_none_on_error(api_client, mock_client):
+    """Test _read_register_blocking returns None on Modbus read error."""
     mock_client.read_holding_registers.return_value = _make_modbus_error()
     definition = RegisterDefinition(1200)
 
-    value = await api_client._read_register(definition, "slave")
+    value = api_client._read_register_blocking(definition)
 
     assert value is None
 
 
-@pytest.mark.asyncio
-async def test_fallback_used_when_primary_returns_none(api_client, mock_client):
+def test_fallback_used_when_primary_returns_none(api_client, mock_client):
     """Test that fallback register is read when primary deserializes to None."""
     # Primary returns 0xFFFF (sensor error) → convert_signed_16bit returns None
     # Fallback returns valid value
@@ -312,17 +313,13 @@ async def test_fallback_used_when_primary_returns_none(api_client, mock_client):
         fallback=RegisterDefinition(1093, deserializer=convert_signed_16bit),
     )
 
-    # Simulate the read_values fallback logic
-    value = await api_client._read_register(definition, "slave")
-    if value is None and definition.fallback:
-        value = await api_client._read_register(definition.fallback, "slave")
+    value = api_client._read_registers_blocking({"temp": definition})["temp"]
 
     assert value == 350
     assert mock_client.read_holding_registers.call_count == 2
 
 
-@pytest.mark.asyncio
-async def test_fallback_not_used_when_primary_succeeds(api_client, mock_client):
+def test_fallback_not_used_when_primary_succeeds(api_client, mock_client):
     """Test that fallback is NOT read when primary returns a valid value."""
     mock_client.read_holding_registers.return_value = _make_modbus_result(350)
 
@@ -332,17 +329,14 @@ async def test_fallback_not_used_when_primary_succeeds(api_client, mock_client):
         fallback=RegisterDefinition(1093, deserializer=lambda v: v),
     )
 
-    value = await api_client._read_register(definition, "slave")
-    if value is None and definition.fallback:
-        value = await api_client._read_register(definition.fallback, "slave")
+    value = api_client._read_registers_blocking({"temp": definition})["temp"]
 
     assert value == 350
     # Only one read — fallback was never called
     assert mock_client.read_holding_registers.call_count == 1
 
 
-@pytest.mark.asyncio
-async def test_fallback_used_when_primary_read_errors(api_client, mock_client):
+def test_fallback_used_when_primary_read_errors(api_client, mock_client):
     """Test that fallback is read when primary has a Modbus read error."""
     primary_result = _make_modbus_error()
     fallback_result = _make_modbus_result(280)
@@ -354,16 +348,13 @@ async def test_fallback_used_when_primary_read_errors(api_client, mock_client):
         fallback=RegisterDefinition(1093),
     )
 
-    value = await api_client._read_register(definition, "slave")
-    if value is None and definition.fallback:
-        value = await api_client._read_register(definition.fallback, "slave")
+    value = api_client._read_registers_blocking({"temp": definition})["temp"]
 
     assert value == 280
     assert mock_client.read_holding_registers.call_count == 2
 
 
-@pytest.mark.asyncio
-async def test_fallback_also_fails_returns_none(api_client, mock_client):
+def test_fallback_also_fails_returns_none(api_client, mock_client):
     """Test that None is returned when both primary and fallback fail."""
     mock_client.read_holding_registers.return_value = _make_modbus_error()
 
@@ -372,9 +363,7 @@ async def test_fallback_also_fails_returns_none(api_client, mock_client):
         fallback=RegisterDefinition(1093),
     )
 
-    value = await api_client._read_register(definition, "slave")
-    if value is None and definition.fallback:
-        value = await api_client._read_register(definition.fallback, "slave")
+    value = api_client._read_registers_blocking({"temp": definition})["temp"]
 
     assert value is None
     assert mock_client.read_holding_registers.call_count == 2
@@ -390,10 +379,15 @@ def _make_preflight_api_client(mock_hass, mock_client):
         api._hass = mock_hass
         api._client = mock_client
         api._slave = 1
+        api._device_kwargs = {"slave": 1}
         api._data = {}
         api._register_map = AtwMbs02RegisterMap()
         api._gateway_not_ready_since = None
         api._gateway_not_ready_last_log = 0.0
+        api._caps = 0
+        api._caps_system_config = None
+        api._state_issue = None
+        api._state_issues_synced = False
         return api
 
 
@@ -456,6 +450,68 @@ async def test_read_values_returns_success_on_normal_read(
     assert result == ReadResult.SUCCESS
 
 
+@patch("custom_components.hitachi_yutaki.api.modbus.ir")
+@pytest.mark.asyncio
+async def test_read_values_does_not_reread_system_state(
+    mock_ir, mock_hass, mock_client
+):
+    """The preflight read is reused: system_state costs a single Modbus read."""
+    api = _make_preflight_api_client(mock_hass, mock_client)
+    mock_client.read_holding_registers.return_value = _make_modbus_result(0)
+
+    result = await api.read_values(["system_state"])
+
+    assert result == ReadResult.SUCCESS
+    assert mock_client.read_holding_registers.call_count == 1
+
+
+@patch("custom_components.hitachi_yutaki.api.modbus.ir")
+@pytest.mark.asyncio
+async def test_read_values_reads_registers_in_one_executor_job(
+    mock_ir, mock_hass, mock_client
+):
+    """All requested registers are read in a single job after the preflight."""
+    api = _make_preflight_api_client(mock_hass, mock_client)
+    mock_client.read_holding_registers.return_value = _make_modbus_result(0)
+
+    result = await api.read_values(["system_state", "outdoor_temp", "water_inlet_temp"])
+
+    assert result == ReadResult.SUCCESS
+    assert api._data["outdoor_temp"] == 0
+    assert api._data["water_inlet_temp"] == 0
+    assert mock_client.read_holding_registers.call_count == 3
+    # Preflight + one batched register read
+    assert mock_hass.async_add_executor_job.call_count == 2
+
+
+@patch("custom_components.hitachi_yutaki.api.modbus.ir")
+@pytest.mark.asyncio
+async def test_read_values_system_state_issue_only_on_transitions(
+    mock_ir, mock_hass, mock_client
+):
+    """System state repair issues are not re-created or re-deleted every poll."""
+    api = _make_preflight_api_client(mock_hass, mock_client)
+    issue_keys = set(api._register_map.system_state_issues.values())
+
+    mock_client.read_holding_registers.return_value = _make_modbus_result(0)
+    await api.read_values(["system_state"])
+    await api.read_values(["system_state"])
+    assert mock_ir.async_delete_issue.call_count == len(issue_keys)
+    mock_ir.async_create_issue.assert_not_called()
+
+    mock_client.read_holding_registers.return_value = _make_modbus_result(2)
+    await api.read_values(["system_state"])
+    await api.read_values(["system_state"])
+    mock_ir.async_create_issue.assert_called_once()
+
+    mock_ir.reset_mock()
+    mock_client.read_holding_registers.return_value = _make_modbus_result(0)
+    await api.read_values(["system_state"])
+    await api.read_values(["system_state"])
+    assert mock_ir.async_delete_issue.call_count == len(issue_keys)
+    mock_ir.async_create_issue.assert_not_called()
+
+
 @pytest.mark.asyncio
 @patch("custom_components.hitachi_yutaki.api.modbus.ir")
 async def test_read_values_throttles_gateway_not_ready_logs(
@@ -650,6 +706,26 @@ async def test_read_values_logs_periodic_reminder_after_5_minutes(
         assert "5 minutes" in reminders[0].message
 
 
+def test_capability_flags_follow_system_config_changes(mock_hass, mock_client):
+    """has_* predicates are re-decoded whenever system_config changes."""
+    api = _make_preflight_api_client(mock_hass, mock_client)
+    rmap = api._register_map
+
+    api._data["system_config"] = rmap.mask_dhw
+    assert api.has_dhw
+    assert not api.has_pool
+    assert not api.has_circuit(CIRCUIT_PRIMARY_ID, CIRCUIT_MODE_HEATING)
+
+    api._data["system_config"] = (
+        rmap.mask_pool | rmap.masks_circuit[(CIRCUIT_PRIMARY_ID, CIRCUIT_MODE_HEATING)]
+    )
+    assert not api.has_dhw
+    assert api.has_pool
+    assert api.has_circuit(CIRCUIT_PRIMARY_ID, CIRCUIT_MODE_HEATING)
+    assert not api.has_circuit(CIRCUIT_PRIMARY_ID, CIRCUIT_MODE_COOLING)
+    assert not api.has_circuit(CIRCUIT_SECONDARY_ID, CIRCUIT_MODE_HEATING)
+
+
 def test_get_operation_state_reads_data():
     """get_operation_state returns the deserialized operation_state from _data."""
     with patch.object(ModbusApiClient, "__init__", lambda x, *args, **kwargs: None):
@@ -674,8 +750,11 @@ def pre2016_api_client(mock_hass, mock_client):
         api._hass = mock_hass
         api._client = mock_client
         api._slave = 1
+        api._device_kwargs = {"slave": 1}
         api._register_map = AtwMbs02Pre2016RegisterMap()
         api._data = {}
+        api._caps = 0
+        api._caps_system_config = None
         write_result = MagicMock()
         write_result.isError.return_value = False
         mock_client.write_register.return_value = write_result
@@ -1,5 +1,9 @@
 """Tests for COP domain service — mode filtering via operation_mode."""
 
+from datetime import datetime, timedelta
+
+import pytest
+
 from custom_components.hitachi_yutaki.adapters.storage.in_memory import InMemoryStorage
 from custom_components.hitachi_yutaki.domain.models.cop import (
     COPInput,
@@ -67,7 +71,7 @@ def _build_service(*, expected_mode: str | None = None) -> COPService:
 
 def _force_measurement(service: COPService, data: COPInput) -> None:
     """Force a measurement by resetting the last measurement time."""
-    service._last_measurement_time = 0.0
+    service._last_measurement_time = float("-inf")
     service.update(data)
 
 
@@ -180,7 +184,7 @@ class TestCOPTransientNoneTimer:
         interval gate, dropping a valid measurement.
         """
         fixed_now = 10_000.0
-        monkeypatch.setattr(cop_module, "time", lambda: fixed_now)
+        monkeypatch.setattr(cop_module, "monotonic", lambda: fixed_now)
 
         service = _build_service(expected_mode=None)
         # Open the gate: last measurement is older than the interval.
@@ -201,7 +205,7 @@ class TestCOPTransientNoneTimer:
     def test_timer_not_advanced_on_invalid_input(self, monkeypatch):
         """The interval timer must stay put when a required input is None."""
         fixed_now = 10_000.0
-        monkeypatch.setattr(cop_module, "time", lambda: fixed_now)
+        monkeypatch.setattr(cop_module, "monotonic", lambda: fixed_now)
 
         service = _build_service(expected_mode=None)
         sentinel = fixed_now - COP_MEASUREMENTS_INTERVAL - 1
@@ -216,7 +220,7 @@ class TestCOPTransientNoneTimer:
     def test_timer_advanced_on_valid_input(self, monkeypatch):
         """The interval timer must advance exactly when a valid measurement is attempted."""
         fixed_now = 10_000.0
-        monkeypatch.setattr(cop_module, "time", lambda: fixed_now)
+        monkeypatch.setattr(cop_module, "monotonic", lambda: fixed_now)
 
         service = _build_service(expected_mode=None)
         service._last_measurement_time = fixed_now - COP_MEASUREMENTS_INTERVAL - 1
@@ -226,3 +230,194 @@ class TestCOPTransientNoneTimer:
         assert service._last_measurement_time == fixed_now, (
             "Timer must advance to now when a valid measurement is attempted"
         )
+
+
+def _reference_cop(measurements: list[PowerMeasurement]) -> float | None:
+    """Integrate a measurement window from scratch (trapezoidal rule)."""
+    thermal = electrical = 0.0
+    for previous, current in zip(measurements, measurements[1:], strict=False):
+        hours = (current.timestamp - previous.timestamp).total_seconds() / 3600
+        thermal += (previous.thermal_power + current.thermal_power) / 2 * hours
+        electrical += (previous.electrical_power + current.electrical_power) / 2 * hours
+    return thermal / electrical if electrical else None
+
+
+class TestEnergyAccumulatorCop:
+    """Tests for the trapezoidal COP integration of EnergyAccumulator."""
+
+    @staticmethod
+    def _accumulator() -> EnergyAccumulator:
+        storage: InMemoryStorage[PowerMeasurement] = InMemoryStorage(
+            max_len=COP_MEASUREMENTS_HISTORY_SIZE,
+        )
+        return EnergyAccumulator(storage=storage, period=COP_MEASUREMENTS_PERIOD)
+
+    def test_no_measurements_returns_none(self):
+        """An empty history has no COP."""
+        assert self._accumulator().get_cop() is None
+
+    def test_trapezoidal_integration(self):
+        """COP is the ratio of trapezoid-integrated thermal and electrical energy."""
+        accumulator = self._accumulator()
+        start = datetime(2026, 1, 1, 12, 0)
+        # thermal ramps 4 -> 6 kW, electrical steady at 1 kW, over 20 minutes
+        for minute, thermal in ((0, 4.0), (10, 6.0), (20, 6.0)):
+            accumulator.add_measurement(
+                thermal, 1.0, timestamp=start + timedelta(minutes=minute)
+            )
+
+        # thermal: (4+6)/2*10 + (6+6)/2*10 = 110 kW.min, electrical: 20 kW.min
+        assert accumulator.get_cop() == pytest.approx(110 / 20)
+
+    def test_sliding_window_matches_full_integration(self):
+        """Incremental sums stay equal to a full re-integration of the window."""
+        accumulator = self._accumulator()
+        start = datetime(2026, 1, 1, 12, 0)
+        for minute in range(90):
+            accumulator.add_measurement(
+                4.0 + (minute % 7) * 0.3,
+                1.0 + (minute % 5) * 0.1,
+                timestamp=start + timedelta(minutes=minute),
+            )
+            expected = _reference_cop(accumulator.measurements)
+            if expected is None:
+                assert accumulator.get_cop() is None
+            else:
+                assert accumulator.get_cop() == pytest.approx(expected)
+
+        # Only the configured period is retained
+        measurements = accumulator.measurements
+        assert measurements[-1].timestamp - measurements[0].timestamp <= (
+            COP_MEASUREMENTS_PERIOD
+        )
+
+    def test_bulk_load_older_history_after_live_sample(self):
+        """Replayed history older than a live sample is merged in order."""
+        accumulator = self._accumulator()
+        start = datetime(2026, 1, 1, 12, 0)
+        accumulator.add_measurement(5.0, 1.0, timestamp=start + timedelta(minutes=20))
+
+        accumulator.bulk_load(
+            PowerMeasurement(start + timedelta(minutes=minute), 4.0, 1.0)
+            for minute in (10, 0)
+        )
+
+        timestamps = [m.timestamp for m in accumulator.measurements]
+        assert timestamps == sorted(timestamps)
+        assert accumulator.get_cop() == pytest.approx(
+            _reference_cop(accumulator.measurements)
+        )
+
+    def test_bulk_load_sorts_unless_told_input_is_ordered(self):
+        """bulk_load sorts by default and streams ordered input as given."""
+        start = datetime(2026, 1, 1, 12, 0)
+        samples = [
+            PowerMeasurement(start + timedelta(minutes=minute), 4.0 + minute, 1.0)
+            for minute in (0, 5, 10)
+        ]
+
+        unsorted = self._accumulator()
+        unsorted.bulk_load(reversed(samples))
+        assert unsorted.measurements == samples
+
+        streamed = self._accumulator()
+        streamed.bulk_load(iter(samples), assume_sorted=True)
+        assert streamed.measurements == samples
+        assert streamed.get_cop() == pytest.approx(unsorted.get_cop())
+
+    def test_bulk_load_keeps_only_retention_window(self):
+        """A long replay keeps only the last period and integrates it once."""
+        accumulator = self._accumulator()
+        start = datetime(2026, 1, 1, 12, 0)
+        accumulator.bulk_load(
+            [
+                PowerMeasurement(
+                    start + timedelta(minutes=minute), 3.0 + minute % 3, 1.0
+                )
+                for minute in range(0, 90, 5)
+            ],
+            assume_sorted=True,
+        )
+
+        measurements = accumulator.measurements
+        assert measurements[0].timestamp == start + timedelta(minutes=55)
+        assert measurements[-1].timestamp == start + timedelta(minutes=85)
+        assert accumulator.get_cop() == pytest.approx(_reference_cop(measurements))
+
+    def test_bulk_load_streams_into_bounded_storage(self):
+        """A streamed replay longer than the storage keeps the newest samples."""
+        storage: InMemoryStorage[PowerMeasurement] = InMemoryStorage(max_len=3)
+        accumulator = EnergyAccumulator(storage=storage, period=COP_MEASUREMENTS_PERIOD)
+        start = datetime(2026, 1, 1, 12, 0)
+        accumulator.bulk_load(
+            (
+                PowerMeasurement(start + timedelta(minutes=minute), float(minute), 1.0)
+                for minute in range(10)
+            ),
+            assume_sorted=True,
+        )
+
+        measurements = accumulator.measurements
+        assert [m.thermal_power for m in measurements] == [7.0, 8.0, 9.0]
+        assert accumulator.get_cop() == pytest.approx(_reference_cop(measurements))
+
+    def test_capacity_eviction_keeps_sums_consistent(self):
+        """Items dropped by a bounded storage are removed from the sums."""
+        storage: InMemoryStorage[PowerMeasurement] = InMemoryStorage(max_len=3)
+        accumulator = EnergyAccumulator(storage=storage, period=COP_MEASUREMENTS_PERIOD)
+        start = datetime(2026, 1, 1, 12, 0)
+        for minute, thermal in enumerate((8.0, 4.0, 4.0, 5.0)):
+            accumulator.add_measurement(
+                thermal, 1.0, timestamp=start + timedelta(minutes=minute * 5)
+            )
+
+        assert len(accumulator.measurements) == 3
+        assert accumulator.get_cop() == pytest.approx(
+            _reference_cop(accumulator.measurements)
+        )
+
+    def test_results_cached_until_window_changes(self):
+        """Repeated reads reuse the cached result; a new sample refreshes it."""
+        accumulator = self._accumulator()
+        start = datetime(2026, 1, 1, 12, 0)
+        for minute in (0, 10):
+            accumulator.add_measurement(
+                4.0, 1.0, timestamp=start + timedelta(minutes=minute)
+            )
+
+        quality = accumulator.get_quality()
+        assert accumulator.get_quality() is quality
+        assert accumulator.get_cop() == pytest.approx(4.0)
+
+        accumulator.add_measurement(6.0, 1.0, timestamp=start + timedelta(minutes=20))
+
+        assert accumulator.get_quality().measurements == 3
+        assert accumulator.get_cop() == pytest.approx(90 / 20)
+
+    def test_out_of_range_cop_is_rejected(self):
+        """A COP above the plausible heat pump range is discarded."""
+        accumulator = self._accumulator()
+        start = datetime(2026, 1, 1, 12, 0)
+        for minute in (0, 10, 20):
+            accumulator.add_measurement(
+                20.0, 1.0, timestamp=start + timedelta(minutes=minute)
+            )
+
+        assert accumulator.get_cop() is None
+
+    def test_service_value_follows_preloaded_history(self):
+        """The rounded service value is cached but refreshed by a preload."""
+        service = _build_service()
+        assert service.get_value() is None
+
+        start = datetime(2026, 1, 1, 12, 0)
+        service.preload_measurements(
+            [
+                PowerMeasurement(start + timedelta(minutes=minute), 4.0, 1.5)
+                for minute in (0, 10)
+            ],
+            assume_sorted=True,
+        )
+
+        assert service.get_value() == round(4.0 / 1.5, 2)
+        assert service.get_value() == round(4.0 / 1.5, 2)
@@ -51,7 +51,7 @@ class TestDefrostGuard:
         assert guard.state == DefrostState.NORMAL
         assert guard.is_data_reliable is True
 
-    @patch("custom_components.hitachi_yutaki.domain.services.defrost_guard.time")
+    @patch("custom_components.hitachi_yutaki.domain.services.defrost_guard.monotonic")
     def test_recovery_to_normal_on_timeout(self, mock_time):
         """Test RECOVERY → NORMAL when safety timeout elapses."""
         guard = DefrostGuard(stable_readings_required=3, recovery_timeout=300.0)
@@ -203,3 +203,11 @@ class TestDefrostGuard:
         assert guard.state == DefrostState.DEFROST
         guard.update(is_defrosting=True, delta_t=0.0)
         assert guard.state == DefrostState.DEFROST
+
+    def test_truthy_non_bool_defrost_flag(self):
+        """Test that integer defrost flags drive transitions like booleans."""
+        guard = DefrostGuard()
+        guard.update(is_defrosting=1, delta_t=5.0)
+        assert guard.state == DefrostState.DEFROST
+        guard.update(is_defrosting=0, delta_t=-2.0)
+        assert guard.state == DefrostState.RECOVERY
@@ -78,3 +78,49 @@ class TestNegativeDurationGuard:
         # The valid post-seam transitions still produce real positive averages.
         assert run == 60
         assert rest == 60
+
+
+class TestAverageWindow:
+    """Averages only cover the last max_history timings."""
+
+    def test_averages_follow_trimmed_history(self):
+        """Timings beyond max_history drop out of the averages."""
+        base = datetime(2026, 7, 1, 0, 0, 0)
+        history = _history()
+        now = base
+        # 15 on/off cycles with growing run times (1..15 min) and 5 min rests.
+        for run_minutes in range(1, 16):
+            history.add_state(True, timestamp=now)
+            now += timedelta(minutes=run_minutes)
+            history.add_state(False, timestamp=now)
+            now += timedelta(minutes=5)
+        history.add_state(True, timestamp=now)
+
+        cycle, run, rest = history.get_average_times()
+        assert run == sum(range(6, 16)) / 10
+        assert rest == 5
+        assert cycle == sum(range(6, 16)) / 10 + 5
+
+        history.clear()
+        assert history.get_average_times() == (None, None, None)
+
+    def test_bulk_load_matches_live_replay(self):
+        """A bulk load yields the same averages as feeding states one by one."""
+        base = datetime(2026, 7, 1, 0, 0, 0)
+        states = [
+            (base + timedelta(minutes=minute), minute % 20 < 7)
+            for minute in range(0, 240, 3)
+        ]
+
+        seed = base - timedelta(minutes=30)
+        live = _history()
+        live.add_state(False, timestamp=seed)
+        for timestamp, is_running in states:
+            live.add_state(is_running, timestamp=timestamp)
+
+        loaded = _history()
+        loaded.add_state(False, timestamp=seed)
+        loaded.bulk_load(reversed(states))
+
+        assert live.get_average_times()[0] is not None
+        assert loaded.get_average_times() == live.get_average_times()
@@ -1,5 +1,6 @@
 """Tests for ThermalEnergyAccumulator logic."""
 
+from datetime import date, datetime, timedelta
 from unittest.mock import patch
 
 import pytest
@@ -28,17 +29,31 @@ class TestThermalEnergyAccumulator:
         assert acc.last_heating_power == 0.0
         assert acc.last_cooling_power == 0.0
 
+    def test_restore_only_given_counters(self):
+        """Test restore() overwrites the given counters and keeps the others."""
+        acc = ThermalEnergyAccumulator(1.0, 10.0, 2.0, 20.0)
+        acc.restore(total_heating=42.5, daily_cooling=0.5)
+        assert acc.daily_heating_energy == 1.0
+        assert acc.total_heating_energy == 42.5
+        assert acc.daily_cooling_energy == 0.5
+        assert acc.total_cooling_energy == 20.0
+
+    @patch(
+        "custom_components.hitachi_yutaki.domain.services.thermal.accumulator.monotonic"
+    )
     @patch("custom_components.hitachi_yutaki.domain.services.thermal.accumulator.time")
-    def test_heating_accumulation(self, mock_time):
+    def test_heating_accumulation(self, mock_time, mock_monotonic):
         """Test heating energy accumulation."""
         acc = ThermalEnergyAccumulator()
 
         # Start at T=0
         mock_time.return_value = 1000.0
+        mock_monotonic.return_value = 1000.0
         acc.update(heating_power=10.0, cooling_power=0.0, compressor_running=True)
 
         # T=3600 (1 hour later)
         mock_time.return_value = 1000.0 + 3600.0
+        mock_monotonic.return_value = 1000.0 + 3600.0
         acc.update(heating_power=10.0, cooling_power=0.0, compressor_running=True)
 
         # Energy = avg_power * hours = 10kW * 1h = 10kWh
@@ -46,11 +61,31 @@ class TestThermalEnergyAccumulator:
         assert acc.total_heating_energy == 10.0
         assert acc.last_heating_power == 10.0
 
+    @patch(
+        "custom_components.hitachi_yutaki.domain.services.thermal.accumulator.monotonic"
+    )
+    @patch("custom_components.hitachi_yutaki.domain.services.thermal.accumulator.time")
+    def test_total_does_not_drift_on_small_increments(self, mock_time, mock_monotonic):
+        """Test many small increments on a large total are summed accurately."""
+        acc = ThermalEnergyAccumulator(initial_total_heating=1_000_000.0)
+
+        # 0.36 kW over 10 s = 0.001 kWh per step
+        for step in range(10_001):
+            mock_time.return_value = 1000.0 + step * 10.0
+            mock_monotonic.return_value = 1000.0 + step * 10.0
+            acc.update(heating_power=0.36, cooling_power=0.0, compressor_running=True)
+
+        assert acc.total_heating_energy == pytest.approx(1_000_010.0, abs=1e-9)
+
+    @patch(
+        "custom_components.hitachi_yutaki.domain.services.thermal.accumulator.monotonic"
+    )
     @patch("custom_components.hitachi_yutaki.domain.services.thermal.accumulator.time")
-    def test_post_cycle_lock(self, mock_time):
+    def test_post_cycle_lock(self, mock_time, mock_monotonic):
         """Test the post-cycle lock logic."""
         acc = ThermalEnergyAccumulator()
         mock_time.return_value = 1000.0
+        mock_monotonic.return_value = 1000.0
 
         # 1. Compressor running, heating active
         acc.update(heating_power=10.0, cooling_power=0.0, compressor_running=True)
@@ -76,16 +111,20 @@ class TestThermalEnergyAccumulator:
         assert acc._post_cycle_lock is False
         assert acc.last_heating_power == 2.0
 
+    @patch(
+        "custom_components.hitachi_yutaki.domain.services.thermal.accumulator.monotonic"
+    )
     @patch("custom_components.hitachi_yutaki.domain.services.thermal.accumulator.time")
-    def test_post_cycle_lock_cooling(self, mock_time):
+    def test_post_cycle_lock_cooling(self, mock_time, mock_monotonic):
         """Test the post-cycle lock logic for cooling mode."""
         acc = ThermalEnergyAccumulator()
         mock_time.return_value = 1000.0
+        mock_monotonic.return_value = 1000.0
 
         # 1. Compressor running, cooling active
         acc.update(heating_power=0.0, cooling_power=10.0, compressor_running=True)
         assert acc.last_cooling_power == 10.0
-        assert acc._last_mode == MODE_COOLING
+        assert acc.last_mode == MODE_COOLING
 
         # 2. Compressor stops, cooling still has inertia (delta T < 0)
         acc.update(heating_power=0.0, cooling_power=5.0, compressor_running=False)
@@ -107,15 +146,20 @@ class TestThermalEnergyAccumulator:
         assert acc._post_cycle_lock is False
         assert acc.last_cooling_power == 2.0
 
+    @patch(
+        "custom_components.hitachi_yutaki.domain.services.thermal.accumulator.monotonic"
+    )
     @patch("custom_components.hitachi_yutaki.domain.services.thermal.accumulator.time")
-    def test_zero_power_during_defrost(self, mock_time):
+    def test_zero_power_during_defrost(self, mock_time, mock_monotonic):
         """Test that passing zero powers (as entity layer does during defrost) zeros energy."""
         acc = ThermalEnergyAccumulator()
         mock_time.return_value = 1000.0
+        mock_monotonic.return_value = 1000.0
         acc.update(heating_power=10.0, cooling_power=0.0, compressor_running=True)
 
         # Defrost: entity layer passes zero powers
         mock_time.return_value = 1000.0 + 600.0  # 10 min
+        mock_monotonic.return_value = 1000.0 + 600.0  # 10 min
         acc.update(
             heating_power=0.0,
             cooling_power=0.0,
@@ -129,20 +173,25 @@ class TestThermalEnergyAccumulator:
         assert acc.daily_heating_energy == pytest.approx(0.833, rel=1e-2)
         assert acc.last_heating_power == 0.0
 
+    @patch(
+        "custom_components.hitachi_yutaki.domain.services.thermal.accumulator.monotonic"
+    )
     @patch("custom_components.hitachi_yutaki.domain.services.thermal.accumulator.time")
-    def test_dhw_mode_forces_heating_classification(self, mock_time):
+    def test_dhw_mode_forces_heating_classification(self, mock_time, mock_monotonic):
         """Test that DHW operation_mode forces energy to heating even with negative ΔT."""
         acc = ThermalEnergyAccumulator()
 
         # 1. Unit was cooling circuits → accumulator in "cooling" mode
         mock_time.return_value = 1000.0
+        mock_monotonic.return_value = 1000.0
         acc.update(heating_power=0.0, cooling_power=8.0, compressor_running=True)
-        assert acc._last_mode == MODE_COOLING
+        assert acc.last_mode == MODE_COOLING
         assert acc.last_cooling_power == 8.0
 
         # 2. DHW starts — even if cooling_power > 0 (transient circuit temps),
         #    operation_mode=MODE_DHW should reclassify as heating
         mock_time.return_value = 1000.0 + 3600.0
+        mock_monotonic.return_value = 1000.0 + 3600.0
         acc.update(
             heating_power=0.0,
             cooling_power=6.0,
@@ -151,7 +200,7 @@ class TestThermalEnergyAccumulator:
         )
 
         # Energy should go to heating, not cooling
-        assert acc._last_mode == MODE_HEATING
+        assert acc.last_mode == MODE_HEATING
         assert acc.last_heating_power == 6.0
         assert acc.last_cooling_power == 0.0
         # Only 1h of cooling at avg (8+0)/2 = no — let's check actual values
@@ -160,16 +209,21 @@ class TestThermalEnergyAccumulator:
         # Heating energy = avg(0, 6) * 1h = 3.0 kWh (first heating sample, last was 0)
         assert acc.daily_heating_energy == pytest.approx(3.0, rel=1e-2)
 
+    @patch(
+        "custom_components.hitachi_yutaki.domain.services.thermal.accumulator.monotonic"
+    )
     @patch("custom_components.hitachi_yutaki.domain.services.thermal.accumulator.time")
-    def test_pool_mode_forces_heating_classification(self, mock_time):
+    def test_pool_mode_forces_heating_classification(self, mock_time, mock_monotonic):
         """Test that pool operation_mode forces energy to heating."""
         acc = ThermalEnergyAccumulator()
 
         mock_time.return_value = 1000.0
+        mock_monotonic.return_value = 1000.0
         acc.update(heating_power=0.0, cooling_power=5.0, compressor_running=True)
-        assert acc._last_mode == MODE_COOLING
+        assert acc.last_mode == MODE_COOLING
 
         mock_time.return_value = 1000.0 + 3600.0
+        mock_monotonic.return_value = 1000.0 + 3600.0
         acc.update(
             heating_power=0.0,
             cooling_power=4.0,
@@ -177,16 +231,20 @@ class TestThermalEnergyAccumulator:
             operation_mode=MODE_POOL,
         )
 
-        assert acc._last_mode == MODE_HEATING
+        assert acc.last_mode == MODE_HEATING
         assert acc.last_heating_power == 4.0
         assert acc.last_cooling_power == 0.0
 
+    @patch(
+        "custom_components.hitachi_yutaki.domain.services.thermal.accumulator.monotonic"
+    )
     @patch("custom_components.hitachi_yutaki.domain.services.thermal.accumulator.time")
-    def test_dhw_mode_with_positive_delta_t(self, mock_time):
+    def test_dhw_mode_with_positive_delta_t(self, mock_time, mock_monotonic):
         """Test that DHW with positive ΔT (normal case) still works correctly."""
         acc = ThermalEnergyAccumulator()
 
         mock_time.return_value = 1000.0
+        mock_monotonic.return_value = 1000.0
         acc.update(
             heating_power=10.0,
             cooling_power=0.0,
@@ -194,15 +252,87 @@ class TestThermalEnergyAccumulator:
             operation_mode=MODE_DHW,
         )
 
-        assert acc._last_mode == MODE_HEATING
+        assert acc.last_mode == MODE_HEATING
         assert acc.last_heating_power == 10.0
         assert acc.last_cooling_power == 0.0
 
+    @patch(
+        "custom_components.hitachi_yutaki.domain.services.thermal.accumulator.monotonic"
+    )
+    @patch("custom_components.hitachi_yutaki.domain.services.thermal.accumulator.time")
+    def test_daily_reset_at_midnight(self, mock_time, mock_monotonic):
+        """Test daily counters reset once the next local midnight is reached."""
+        tomorrow = date.today() + timedelta(days=1)
+        midnight = datetime.combine(tomorrow, datetime.min.time()).timestamp()
+        acc = ThermalEnergyAccumulator(initial_daily_heating=5.0)
+
+        mock_time.return_value = midnight - 3600.0
+        mock_monotonic.return_value = midnight - 3600.0
+        acc.update(heating_power=10.0, cooling_power=0.0, compressor_running=True)
+        assert acc.daily_heating_energy == 5.0
+        assert acc.last_reset_date == date.today()
+
+        mock_time.return_value = midnight + 3600.0
+        mock_monotonic.return_value = midnight + 3600.0
+        acc.update(heating_power=10.0, cooling_power=0.0, compressor_running=True)
+
+        # Daily counter restarts; the interval spanning midnight is credited
+        # to the new day (2h at 10kW)
+        assert acc.daily_heating_energy == 20.0
+        assert acc.total_heating_energy == 20.0
+        assert acc.last_reset_date == tomorrow
+        assert acc.daily_start_time == midnight + 3600.0
+
+    @patch(
+        "custom_components.hitachi_yutaki.domain.services.thermal.accumulator.monotonic"
+    )
+    @patch("custom_components.hitachi_yutaki.domain.services.thermal.accumulator.time")
+    def test_idle_before_first_activity_does_not_start_clock(
+        self, mock_time, mock_monotonic
+    ):
+        """Test zero power before any activity leaves the accumulator untouched."""
+        acc = ThermalEnergyAccumulator()
+
+        mock_time.return_value = 1000.0
+        mock_monotonic.return_value = 1000.0
+        acc.update(heating_power=0.0, cooling_power=0.0, compressor_running=False)
+        assert acc.last_mode is None
+        assert acc.last_measurement_time == 0
+        assert acc.daily_start_time == 0
+
+        mock_time.return_value = 1000.0 + 3600.0
+        mock_monotonic.return_value = 1000.0 + 3600.0
+        acc.update(heating_power=10.0, cooling_power=0.0, compressor_running=True)
+
+        # First active sample only starts the clock
+        assert acc.daily_heating_energy == 0.0
+        assert acc.last_mode == MODE_HEATING
+
+    @patch(
+        "custom_components.hitachi_yutaki.domain.services.thermal.accumulator.monotonic"
+    )
+    @patch("custom_components.hitachi_yutaki.domain.services.thermal.accumulator.time")
+    def test_wall_clock_jump_does_not_affect_energy(self, mock_time, mock_monotonic):
+        """Test energy follows the monotonic clock when wall time jumps back."""
+        acc = ThermalEnergyAccumulator()
+
+        mock_time.return_value = 10000.0
+        mock_monotonic.return_value = 500.0
+        acc.update(heating_power=10.0, cooling_power=0.0, compressor_running=True)
+
+        # Wall clock steps back an hour while 30 minutes really elapse
+        mock_time.return_value = 10000.0 - 3600.0
+        mock_monotonic.return_value = 500.0 + 1800.0
+        acc.update(heating_power=10.0, cooling_power=0.0, compressor_running=True)
+
+        assert acc.daily_heating_energy == 5.0
+        assert acc.total_heating_energy == 5.0
+
     def test_none_operation_mode_preserves_existing_behavior(self):
         """Test that omitting operation_mode keeps the ΔT-based classification."""
         acc = ThermalEnergyAccumulator()
 
         # Without operation_mode, cooling_power > 0 → classified as cooling
         acc.update(heating_power=0.0, cooling_power=5.0, compressor_running=True)
-        assert acc._last_mode == MODE_COOLING
+        assert acc.last_mode == MODE_COOLING
         assert acc.last_cooling_power == 5.0
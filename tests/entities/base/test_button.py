@@ -0,0 +1,31 @@
+"""Tests for the base button entity factory."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.hitachi_yutaki.const import DEVICE_PRIMARY_COMPRESSOR
+from custom_components.hitachi_yutaki.entities.base.button import (
+    HitachiYutakiButtonEntityDescription,
+    _create_buttons,
+)
+
+
+def test_buttons_without_action_are_skipped():
+    """A description without action_fn creates no entity; the others do."""
+    descriptions = (
+        HitachiYutakiButtonEntityDescription(
+            key="reset_history",
+            translation_key="reset_history",
+            action_fn=AsyncMock(),
+        ),
+        HitachiYutakiButtonEntityDescription(
+            key="no_action",
+            translation_key="no_action",
+        ),
+    )
+
+    buttons = _create_buttons(
+        MagicMock(), "test_entry", descriptions, DEVICE_PRIMARY_COMPRESSOR
+    )
+
+    assert [button.entity_description.key for button in buttons] == ["reset_history"]
+    assert buttons[0].unique_id == "test_entry_reset_history"
@@ -1,8 +1,10 @@
-"""Tests for the climate entity hvac_action resolution."""
+"""Tests for the climate entity hvac_action resolution and toggling."""
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from custom_components.hitachi_yutaki.entities.base.climate import (
     HitachiYutakiClimate,
@@ -81,6 +83,12 @@ class TestHvacAction:
         climate = _make_climate(unit_mode=HVACMode.COOL)
         assert climate.hvac_action == HVACAction.COOLING
 
+    def test_unit_mode_read_once(self):
+        """The unit mode register is read once per hvac_action evaluation."""
+        climate = _make_climate(unit_mode=HVACMode.HEAT)
+        assert climate.hvac_action == HVACAction.HEATING
+        climate.coordinator.api_client.get_unit_mode.assert_called_once()
+
     def test_off_returns_off(self):
         """Powered-off circuit returns OFF."""
         climate = _make_climate(circuit_power=False)
@@ -108,3 +116,34 @@ class TestHvacAction:
         climate = _make_climate(unit_mode=HVACMode.HEAT)
         climate.coordinator.data = None
         assert climate.hvac_action is None
+
+
+class TestToggle:
+    """Tests for async_toggle."""
+
+    @pytest.mark.asyncio
+    async def test_toggle_powered_circuit_turns_off(self):
+        """A powered circuit is turned off without resolving the unit mode."""
+        climate = _make_climate(circuit_power=True)
+        with (
+            patch.object(climate, "async_turn_on", AsyncMock()) as turn_on,
+            patch.object(climate, "async_turn_off", AsyncMock()) as turn_off,
+        ):
+            await climate.async_toggle()
+
+        turn_off.assert_awaited_once()
+        turn_on.assert_not_awaited()
+        climate.coordinator.api_client.get_unit_mode.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_toggle_unpowered_circuit_turns_on(self):
+        """An unpowered circuit is turned on."""
+        climate = _make_climate(circuit_power=False)
+        with (
+            patch.object(climate, "async_turn_on", AsyncMock()) as turn_on,
+            patch.object(climate, "async_turn_off", AsyncMock()) as turn_off,
+        ):
+            await climate.async_toggle()
+
+        turn_on.assert_awaited_once()
+        turn_off.assert_not_awaited()
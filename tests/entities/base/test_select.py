@@ -0,0 +1,70 @@
+"""Tests for the base select entity option mapping."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.hitachi_yutaki.const import OTCCalculationMethod
+from custom_components.hitachi_yutaki.entities.base.select import (
+    HitachiYutakiSelect,
+    HitachiYutakiSelectEntityDescription,
+)
+
+
+def _make_select(value):
+    """Build a select entity whose get_fn returns ``value``."""
+    coordinator = MagicMock()
+    coordinator.api_client = MagicMock()
+    coordinator.data = {"some": "data"}
+    coordinator.async_request_refresh = AsyncMock()
+
+    set_fn = AsyncMock()
+    description = HitachiYutakiSelectEntityDescription(
+        key="otc_calculation_method_heating",
+        translation_key="otc_calculation_method_heating",
+        options=["disabled", "points", "fix"],
+        value_map={
+            "disabled": OTCCalculationMethod.DISABLED,
+            "points": OTCCalculationMethod.POINTS,
+            "fix": OTCCalculationMethod.FIX,
+        },
+        get_fn=lambda api, circuit_id: value,
+        set_fn=set_fn,
+    )
+
+    select = HitachiYutakiSelect(
+        coordinator=coordinator,
+        description=description,
+        device_info=MagicMock(),
+        uid_prefix="test_entry_circuit1_",
+        register_prefix="circuit1",
+    )
+    return select, set_fn
+
+
+def test_current_option_maps_value_to_option():
+    """The register value is translated back to its option key."""
+    select, _ = _make_select(OTCCalculationMethod.POINTS)
+    assert select.current_option == "points"
+
+
+def test_current_option_accepts_plain_string_value():
+    """A raw string equal to an enum value resolves like the enum member."""
+    select, _ = _make_select("fix")
+    assert select.current_option == "fix"
+
+
+def test_current_option_unknown_value_returns_none():
+    """A value outside value_map has no option."""
+    select, _ = _make_select("gradient")
+    assert select.current_option is None
+
+
+@pytest.mark.asyncio
+async def test_select_option_writes_mapped_value():
+    """Selecting an option writes its mapped value for the entity's circuit."""
+    select, set_fn = _make_select(None)
+    await select.async_select_option("points")
+    set_fn.assert_awaited_once_with(
+        select.coordinator.api_client, 1, OTCCalculationMethod.POINTS
+    )
@@ -81,3 +81,47 @@ class TestSensorDispatch:
         assert len(sensors) == 2
         assert type(sensors[0]) is HitachiYutakiSensor
         assert type(sensors[1]) is HitachiYutakiSensor
+
+
+class TestAttributesDispatch:
+    """Tests that extra_state_attributes picks the builder for the sensor key."""
+
+    def test_operation_state_exposes_code(self):
+        """The operation_state sensor reports the raw state code."""
+        coordinator = _make_coordinator()
+        coordinator.data = {"operation_state_code": 6}
+        (sensor,) = _create_sensors(
+            coordinator,
+            "test_entry",
+            (_make_description("operation_state"),),
+            "control_unit",
+        )
+
+        assert sensor.extra_state_attributes == {"code": 6}
+
+    def test_attributes_fn_takes_precedence(self):
+        """A description attributes_fn overrides the key-based builder."""
+        coordinator = _make_coordinator()
+        coordinator.data = {"operation_state_code": 6}
+        description = HitachiYutakiSensorEntityDescription(
+            key="operation_state",
+            attributes_fn=lambda _: {"custom": True},
+        )
+        (sensor,) = _create_sensors(
+            coordinator, "test_entry", (description,), "control_unit"
+        )
+
+        assert sensor.extra_state_attributes == {"custom": True}
+
+    def test_plain_sensor_has_no_attributes(self):
+        """Sensors without a key-specific builder expose no attributes."""
+        coordinator = _make_coordinator()
+        coordinator.data = {"operation_state_code": 6}
+        (sensor,) = _create_sensors(
+            coordinator,
+            "test_entry",
+            (_make_description("compressor_frequency"),),
+            "control_unit",
+        )
+
+        assert sensor.extra_state_attributes is None
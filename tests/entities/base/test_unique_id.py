@@ -0,0 +1,16 @@
+"""Tests for the shared unique ID prefix helper."""
+
+from custom_components.hitachi_yutaki.entities.base.unique_id import (
+    _unique_id_prefix,
+)
+
+
+def test_prefix_includes_register_prefix():
+    """Entities bound to a register prefix are namespaced by it."""
+    assert _unique_id_prefix("entry", "circuit1") == "entry_circuit1_"
+
+
+def test_prefix_without_register_prefix():
+    """Entities without a register prefix only use the entry ID."""
+    assert _unique_id_prefix("entry") == "entry_"
+    assert _unique_id_prefix("entry", None) == "entry_"
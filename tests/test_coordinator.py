@@ -6,6 +6,7 @@ from datetime import date, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
 from custom_components.hitachi_yutaki.api.base import ReadResult
 from custom_components.hitachi_yutaki.const import DOMAIN
@@ -21,7 +22,12 @@ from custom_components.hitachi_yutaki.telemetry import (
     TelemetryLevel,
 )
 from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import (
+    REQUEST_REFRESH_DEFAULT_COOLDOWN,
+    UpdateFailed,
+)
+from homeassistant.util import dt as dt_util
 
 
 @pytest.fixture
@@ -75,6 +81,46 @@ def coordinator(mock_hass, mock_api_client, mock_profile):
     return coord
 
 
+@pytest.mark.asyncio
+async def test_coordinator_skips_listener_updates_on_unchanged_data(coordinator):
+    """Test that entities are not rewritten when a poll returns equal data."""
+    coordinator._async_update_data = AsyncMock(return_value={"outdoor_temp": 5.0})
+    listener = MagicMock()
+
+    with patch.object(coordinator, "_schedule_refresh"):
+        coordinator.async_add_listener(listener)
+        await coordinator.async_refresh()
+        listener.reset_mock()
+
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+
+    listener.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_collapses_refresh_request_bursts(
+    hass: HomeAssistant, mock_api_client, mock_profile
+):
+    """Test that a burst of refresh requests polls the gateway at most twice."""
+    entry = MagicMock()
+    entry.data = {CONF_SCAN_INTERVAL: 5}
+    with patch("custom_components.hitachi_yutaki.coordinator.ir"):
+        coord = HitachiYutakiDataCoordinator(hass, entry, mock_api_client, mock_profile)
+    coord._async_update_data = AsyncMock(return_value={"outdoor_temp": 5.0})
+
+    for _ in range(5):
+        await coord.async_request_refresh()
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=REQUEST_REFRESH_DEFAULT_COOLDOWN + 1),
+    )
+    await hass.async_block_till_done()
+
+    assert 1 <= coord._async_update_data.await_count <= 2
+    await coord.async_shutdown()
+
+
 @pytest.mark.asyncio
 async def test_coordinator_raises_update_failed_on_gateway_not_ready(
     coordinator, mock_api_client
@@ -259,6 +305,27 @@ async def test_modbus_read_values_failure_reports_connection_error(
     mock_ir.async_delete_issue.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_connection_error_issue_only_touched_on_transitions(
+    coordinator, mock_api_client
+):
+    """The connection_error issue is created/deleted on state changes only."""
+    with patch("custom_components.hitachi_yutaki.coordinator.ir") as mock_ir:
+        await coordinator._async_update_data()
+        await coordinator._async_update_data()
+        mock_ir.async_delete_issue.assert_called_once()
+
+        mock_api_client.read_values = AsyncMock(side_effect=ConnectionError("down"))
+        for _ in range(2):
+            with pytest.raises(UpdateFailed):
+                await coordinator._async_update_data()
+        mock_ir.async_create_issue.assert_called_once()
+
+        mock_api_client.read_values = AsyncMock(return_value=ReadResult.SUCCESS)
+        await coordinator._async_update_data()
+        assert mock_ir.async_delete_issue.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_modbus_mid_poll_failure_reports_connection_error(
     coordinator, mock_api_client
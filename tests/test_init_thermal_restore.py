@@ -0,0 +1,77 @@
+"""Tests for restoring thermal energy counters at setup."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.hitachi_yutaki import _async_restore_thermal_energy
+
+
+def _stored_state(value: str, last_updated: datetime) -> MagicMock:
+    """Build a restore-cache entry as returned by RestoreStateData."""
+    stored = MagicMock()
+    stored.state.state = value
+    stored.state.last_updated = last_updated
+    return stored
+
+
+async def _restore(last_updated: datetime) -> MagicMock:
+    """Run the thermal restore with every counter last written at last_updated."""
+    entry = MagicMock()
+    entry.entry_id = "entry"
+    coordinator = MagicMock()
+
+    registry = MagicMock()
+    registry.async_get_entity_id.side_effect = lambda domain, platform, unique_id: (
+        f"sensor.{unique_id}"
+    )
+    restore_data = MagicMock()
+    restore_data.last_states = {
+        f"sensor.entry_{key}": _stored_state("12.5", last_updated)
+        for key in (
+            "thermal_energy_heating_daily",
+            "thermal_energy_heating_total",
+            "thermal_energy_cooling_daily",
+            "thermal_energy_cooling_total",
+        )
+    }
+
+    with (
+        patch(
+            "custom_components.hitachi_yutaki.async_get_restore_data",
+            return_value=restore_data,
+        ),
+        patch("custom_components.hitachi_yutaki.er.async_get", return_value=registry),
+    ):
+        await _async_restore_thermal_energy(MagicMock(), entry, coordinator)
+
+    return coordinator.derived_metrics.restore_thermal_energy
+
+
+@pytest.mark.asyncio
+async def test_restores_all_counters_written_today():
+    """Counters last written today are all restored."""
+    restore = await _restore(datetime.now(tz=UTC))
+
+    restored = {call.args[0] for call in restore.call_args_list}
+    assert restored == {
+        "thermal_energy_heating_daily",
+        "thermal_energy_heating_total",
+        "thermal_energy_cooling_daily",
+        "thermal_energy_cooling_total",
+    }
+
+
+@pytest.mark.asyncio
+async def test_skips_daily_counters_from_an_earlier_day():
+    """Daily counters from a previous day start from zero; totals are kept."""
+    restore = await _restore(datetime.now(tz=UTC) - timedelta(days=2))
+
+    restored = {call.args[0] for call in restore.call_args_list}
+    assert restored == {
+        "thermal_energy_heating_total",
+        "thermal_energy_cooling_total",
+    }
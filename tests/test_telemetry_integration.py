@@ -131,6 +131,24 @@ class TestFullCycleCollection:
         # Buffer should be empty after flush
         assert coordinator.telemetry_collector.buffer_size == 0
 
+    @pytest.mark.asyncio
+    async def test_flush_notifies_telemetry_listeners(self):
+        """A flush updates the telemetry sensor even when poll data is unchanged."""
+        coordinator = _make_coordinator(telemetry_level=TelemetryLevel.ON)
+        coordinator.telemetry_collector.collect(_sample_data())
+        listener = MagicMock()
+        remove = coordinator.async_add_telemetry_listener(listener)
+
+        await coordinator.async_flush_telemetry()
+
+        listener.assert_called_once_with()
+        assert coordinator.telemetry_last_send is not None
+
+        remove()
+        coordinator.telemetry_collector.collect(_sample_data())
+        await coordinator.async_flush_telemetry()
+        listener.assert_called_once_with()
+
     @pytest.mark.asyncio
     async def test_flush_empty_buffer_is_noop(self):
         """Flush with no buffered points does nothing."""